@@ -1,16 +1,23 @@
 from __future__ import annotations
 
 import asyncio
+import hashlib
+import heapq
 import json
 import os
 import re
 import subprocess
 import sys
+import threading
+import time
 import uuid
-from datetime import datetime
+from collections import OrderedDict
+from contextlib import asynccontextmanager
+from datetime import datetime, timezone
 from pathlib import Path
-from typing import AsyncGenerator
+from typing import TYPE_CHECKING, AsyncGenerator
 
+import orjson
 import yaml
 from fastapi import FastAPI, HTTPException, Request
 from fastapi.middleware.cors import CORSMiddleware
@@ -19,9 +26,23 @@ from pydantic import BaseModel, Field
 
 from multiplium.runs import RunRegistry
 
+if TYPE_CHECKING:
+    from openai import AsyncOpenAI
+
 WORKSPACE_ROOT = Path(__file__).resolve().parents[1]
 
-app = FastAPI(title="Multiplium Research Dashboard API")
+
+@asynccontextmanager
+async def _lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
+    yield
+    if _openai_client is not None:
+        await _openai_client.close()
+
+
+app = FastAPI(
+    title="Multiplium Research Dashboard API",
+    lifespan=_lifespan,
+)
 app.add_middleware(
     CORSMiddleware,
     allow_origins=["*"],
@@ -212,22 +233,184 @@ Generate 6-8 segments, each with its own markers.
 PROJECTS_FILE = WORKSPACE_ROOT / "data" / "projects.json"
 
 
+# (epoch second, formatted timestamp) of the last _now_iso() call
+_now_iso_cache: tuple[int, str] = (0, "")
+
+
+def _now_iso() -> str:
+    """Return the current UTC time as an ISO-8601 string with a trailing "Z".
+
+    Second resolution; the formatted string is reused for every call within
+    the same second.
+    """
+    global _now_iso_cache
+    now = int(time.time())
+    if now != _now_iso_cache[0]:
+        formatted = datetime.fromtimestamp(now, timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+        _now_iso_cache = (now, formatted)
+    return _now_iso_cache[1]
+
+
+# (st_mtime_ns, st_size, projects) of the last projects.json parse, for read-only endpoints
+_projects_cache: tuple[int, int, dict[str, dict]] | None = None
+_projects_cache_lock = threading.Lock()
+
+
 def load_projects() -> dict[str, dict]:
     """Load projects from JSON file."""
     if PROJECTS_FILE.exists():
         try:
-            with PROJECTS_FILE.open("r") as f:
-                return json.load(f)
+            return orjson.loads(PROJECTS_FILE.read_bytes())
         except Exception:
             pass
     return {}
 
 
+def load_projects_cached() -> dict[str, dict]:
+    """Load projects for read-only use, re-parsing only when projects.json changes.
+
+    The returned dict is shared between requests and must not be mutated;
+    handlers that modify projects should use load_projects() + save_projects().
+    """
+    global _projects_cache
+    try:
+        stat = PROJECTS_FILE.stat()
+    except FileNotFoundError:
+        return {}
+
+    with _projects_cache_lock:
+        cache = _projects_cache
+        if cache is not None and cache[0] == stat.st_mtime_ns and cache[1] == stat.st_size:
+            return cache[2]
+        projects = load_projects()
+        _projects_cache = (stat.st_mtime_ns, stat.st_size, projects)
+        return projects
+
+
 def save_projects(projects: dict[str, dict]) -> None:
-    """Save projects to JSON file."""
+    """Save projects to JSON file.
+
+    Written compactly to a temporary file and renamed over projects.json, so a
+    crash mid-write never leaves a truncated file behind.
+    """
+    global _projects_cache
     PROJECTS_FILE.parent.mkdir(parents=True, exist_ok=True)
-    with PROJECTS_FILE.open("w") as f:
-        json.dump(projects, f, indent=2)
+    data = orjson.dumps(projects, option=orjson.OPT_APPEND_NEWLINE)
+    tmp_path = PROJECTS_FILE.with_suffix(".json.tmp")
+    with _projects_cache_lock:
+        with tmp_path.open("wb") as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, PROJECTS_FILE)
+        # mtime may not change on coarse-grained filesystems; force a re-read
+        _projects_cache = None
+
+
+# Shared across requests so OpenAI calls reuse one HTTP connection pool
+_openai_client: AsyncOpenAI | None = None
+
+# Strong references to pending close() tasks of replaced clients
+_closing_openai_clients: set[asyncio.Task] = set()
+
+
+def _get_openai_client(api_key: str) -> AsyncOpenAI:
+    """Return the shared AsyncOpenAI client, creating it on first use.
+
+    Must be called from a running event loop: when the API key changes, the
+    replaced client's connection pool is closed in the background.
+    """
+    global _openai_client
+    if _openai_client is None or _openai_client.api_key != api_key:
+        from openai import AsyncOpenAI
+
+        replaced = _openai_client
+        _openai_client = AsyncOpenAI(api_key=api_key)
+        if replaced is not None:
+            task = asyncio.get_running_loop().create_task(replaced.close())
+            _closing_openai_clients.add(task)
+            task.add_done_callback(_closing_openai_clients.discard)
+    return _openai_client
+
+
+# In-flight chat completions keyed by a hash of their request parameters
+_inflight_completions: dict[str, asyncio.Future] = {}
+
+# Recent completion content by request hash: (monotonic time stored, content), LRU ordered
+_completion_cache: OrderedDict[str, tuple[float, str | None]] = OrderedDict()
+COMPLETION_CACHE_MAX_ITEMS = 4096
+COMPLETION_CACHE_TTL_SECONDS = 6 * 60 * 60
+
+
+# Fallbacks parsed when a JSON-mode completion comes back empty
+EMPTY_JSON_OBJECT = b"{}"
+EMPTY_QUESTIONS_JSON = b'{"questions": []}'
+
+
+async def _coalesced_completion(
+    client: AsyncOpenAI,
+    *,
+    cache: bool = False,
+    **request_kwargs: object,
+) -> str | None:
+    """Run a chat completion and return the message content.
+
+    Identical requests made while one is already in flight (e.g. the UI firing
+    the same enrichment twice) await that call instead of issuing another.
+    With ``cache=True`` the content is also kept for
+    ``COMPLETION_CACHE_TTL_SECONDS`` and returned for repeat requests.
+    """
+    key = hashlib.blake2b(
+        orjson.dumps(request_kwargs, option=orjson.OPT_SORT_KEYS), digest_size=16
+    ).hexdigest()
+
+    if cache:
+        cached = _completion_cache.get(key)
+        if cached is not None:
+            if time.monotonic() - cached[0] < COMPLETION_CACHE_TTL_SECONDS:
+                _completion_cache.move_to_end(key)
+                return cached[1]
+            del _completion_cache[key]
+
+    task = _inflight_completions.get(key)
+    if task is None:
+        task = asyncio.ensure_future(client.chat.completions.create(**request_kwargs))
+        _inflight_completions[key] = task
+        task.add_done_callback(lambda _: _inflight_completions.pop(key, None))
+    # Shield so one caller disconnecting does not cancel the call for the others
+    response = await asyncio.shield(task)
+    content = response.choices[0].message.content
+
+    if cache:
+        _completion_cache[key] = (time.monotonic(), content)
+        _completion_cache.move_to_end(key)
+        while len(_completion_cache) > COMPLETION_CACHE_MAX_ITEMS:
+            _completion_cache.popitem(last=False)
+    return content
+
+
+def _launch_orchestrator(cmd: list[str], run_id: str) -> None:
+    """Launch a detached orchestrator subprocess logging to the run's stdout file."""
+    stdout_path = registry.stdout_path(run_id)
+
+    # The child gets its own copy of the descriptor as fd 1/2, so the parent
+    # closes its fd as soon as Popen returns. A raw fd avoids building a text
+    # wrapper the parent never writes to; the child runs with -u where it
+    # needs unbuffered logs. env=None inherits os.environ without copying it,
+    # and close_fds keeps unrelated parent descriptors out of the child.
+    stdout_fd = os.open(stdout_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | os.O_CLOEXEC, 0o644)
+    try:
+        subprocess.Popen(
+            cmd,
+            cwd=str(WORKSPACE_ROOT),
+            stdout=stdout_fd,
+            stderr=stdout_fd,
+            env=None,
+            start_new_session=True,  # Detach from parent process
+            close_fds=True,
+        )
+    finally:
+        os.close(stdout_fd)
 
 
 @app.get("/health")
@@ -256,93 +439,147 @@ def get_run_events(run_id: str, limit: int = 200) -> dict[str, list[dict[str, ob
     return {"events": registry.load_events(run_id, limit=limit)}
 
 
-@app.get("/reports")
-def list_reports() -> dict[str, list[dict[str, object]]]:
-    """List all available research reports (both discovery and deep research)."""
-    reports = []
-    
-    # List discovery reports from reports/new/
-    reports_dir = WORKSPACE_ROOT / "reports" / "new"
-    if reports_dir.exists():
-        for report_file in sorted(reports_dir.glob("report_*.json"), reverse=True):
-            try:
-                with report_file.open("r") as f:
-                    data = json.load(f)
-                
-                # Extract summary info
-                total_companies = 0
-                for provider in data.get("providers", []):
-                    for finding in provider.get("findings", []):
-                        total_companies += len(finding.get("companies", []))
-                
-                reports.append({
-                    "path": str(report_file.relative_to(WORKSPACE_ROOT)),
-                    "filename": report_file.name,
-                    "timestamp": data.get("timestamp", ""),
-                    "total_companies": total_companies,
-                    "has_deep_research": bool(data.get("deep_research")),
-                    "providers": [p.get("provider", "") for p in data.get("providers", [])],
-                    "report_type": "discovery",
-                })
-            except Exception:
-                # Skip invalid reports
-                continue
-    
-    # List deep research reports from reports/deep_research/
-    deep_research_dir = WORKSPACE_ROOT / "reports" / "deep_research"
-    if deep_research_dir.exists():
-        for report_file in sorted(deep_research_dir.glob("deep_research_*.json"), reverse=True):
-            try:
-                with report_file.open("r") as f:
-                    data = json.load(f)
-                
-                # Extract summary info from deep research section
-                total_companies = 0
-                if "deep_research" in data:
-                    companies = data["deep_research"].get("companies", [])
-                    total_companies = len(companies)
-                
-                reports.append({
-                    "path": str(report_file.relative_to(WORKSPACE_ROOT)),
-                    "filename": report_file.name,
-                    "timestamp": data.get("generated_at", data.get("timestamp", "")),
-                    "total_companies": total_companies,
-                    "has_deep_research": True,
-                    "providers": ["deep_research"],
-                    "report_type": "deep_research",
-                })
-            except Exception:
-                # Skip invalid reports
-                continue
-    
-    # Also check deep_research/new/ for newer reports
-    deep_research_new_dir = WORKSPACE_ROOT / "reports" / "deep_research" / "new"
-    if deep_research_new_dir.exists():
-        for report_file in sorted(deep_research_new_dir.glob("report_*.json"), reverse=True):
-            try:
-                with report_file.open("r") as f:
-                    data = json.load(f)
-                
-                # Extract summary info from deep research section
-                total_companies = 0
-                if "deep_research" in data:
-                    companies = data["deep_research"].get("companies", [])
-                    total_companies = len(companies)
-                
-                reports.append({
-                    "path": str(report_file.relative_to(WORKSPACE_ROOT)),
-                    "filename": report_file.name,
-                    "timestamp": data.get("generated_at", data.get("timestamp", "")),
-                    "total_companies": total_companies,
-                    "has_deep_research": True,
-                    "providers": ["deep_research"],
-                    "report_type": "deep_research",
-                })
-            except Exception:
-                # Skip invalid reports
+def _newest_reports(directory: Path, prefix: str, limit: int | None = None) -> list[Path]:
+    """Return ``{prefix}*.json`` files in ``directory``, newest (by name) first.
+
+    Report filenames embed a sortable timestamp, so ordering by name avoids a
+    stat per entry. With ``limit`` only the top ``limit`` names are selected.
+    """
+    with os.scandir(directory) as it:
+        names = [
+            entry.name
+            for entry in it
+            if entry.name.startswith(prefix) and entry.name.endswith(".json") and entry.is_file()
+        ]
+    if limit is None:
+        names.sort(reverse=True)
+    else:
+        names = heapq.nlargest(limit, names)
+    return [directory / name for name in names]
+
+
+# report file -> (st_mtime_ns, st_size, summary); reports are effectively
+# immutable once written, so each one is parsed only once while it stays
+# listed. /reports prunes entries for files it no longer lists.
+_report_summaries: dict[Path, tuple[int, int, dict[str, object]]] = {}
+
+
+def _summarize_report(report_file: Path, report_type: str) -> dict[str, object]:
+    """Build the /reports listing entry for a discovery or deep research report."""
+    stat = report_file.stat()
+    cached = _report_summaries.get(report_file)
+    if cached is not None and cached[0] == stat.st_mtime_ns and cached[1] == stat.st_size:
+        return cached[2]
+
+    data = orjson.loads(report_file.read_bytes())
+
+    if report_type == "discovery":
+        # Extract summary info
+        total_companies = 0
+        for provider in data.get("providers", []):
+            for finding in provider.get("findings", []):
+                total_companies += len(finding.get("companies", []))
+
+        summary = {
+            "path": str(report_file.relative_to(WORKSPACE_ROOT)),
+            "filename": report_file.name,
+            "timestamp": data.get("timestamp", ""),
+            "total_companies": total_companies,
+            "has_deep_research": bool(data.get("deep_research")),
+            "providers": [p.get("provider", "") for p in data.get("providers", [])],
+            "report_type": "discovery",
+        }
+    else:
+        # Extract summary info from deep research section
+        total_companies = 0
+        if "deep_research" in data:
+            companies = data["deep_research"].get("companies", [])
+            total_companies = len(companies)
+
+        summary = {
+            "path": str(report_file.relative_to(WORKSPACE_ROOT)),
+            "filename": report_file.name,
+            "timestamp": data.get("generated_at", data.get("timestamp", "")),
+            "total_companies": total_companies,
+            "has_deep_research": True,
+            "providers": ["deep_research"],
+            "report_type": "deep_research",
+        }
+
+    _report_summaries[report_file] = (stat.st_mtime_ns, stat.st_size, summary)
+    return summary
+
+
+# (directory, filename prefix, report type) scanned by /reports, in display order
+REPORT_SOURCES: list[tuple[Path, str, str]] = [
+    # Discovery reports
+    (WORKSPACE_ROOT / "reports" / "new", "report_", "discovery"),
+    # Deep research reports
+    (WORKSPACE_ROOT / "reports" / "deep_research", "deep_research_", "deep_research"),
+    # Newer deep research reports
+    (WORKSPACE_ROOT / "reports" / "deep_research" / "new", "report_", "deep_research"),
+]
+
+# Upper bound on report files summarized concurrently by /reports
+REPORT_SCAN_CONCURRENCY = 16
+
+
+def _collect_report_files(limit: int | None) -> list[tuple[Path, str]]:
+    """Return ``(report_file, report_type)`` pairs for every report source.
+
+    A file reachable from more than one source (e.g. through a symlinked or
+    mirrored directory) is only listed once, under the first source.
+    """
+    report_files: list[tuple[Path, str]] = []
+    seen: set[Path] = set()
+    for directory, prefix, report_type in REPORT_SOURCES:
+        if not directory.exists():
+            continue
+        for report_file in _newest_reports(directory, prefix, limit):
+            resolved = report_file.resolve()
+            if resolved in seen:
                 continue
-    
-    return {"reports": reports}
+            seen.add(resolved)
+            report_files.append((report_file, report_type))
+    return report_files
+
+
+def _try_summarize_report(report_file: Path, report_type: str) -> dict[str, object] | None:
+    try:
+        return _summarize_report(report_file, report_type)
+    except Exception:
+        # Skip invalid reports
+        return None
+
+
+@app.get("/reports")
+async def list_reports(limit: int | None = None) -> dict[str, list[dict[str, object]]]:
+    """List all available research reports (both discovery and deep research).
+
+    ``limit`` caps the number of newest reports read from each reports directory.
+    Reports are summarized concurrently in worker threads.
+    """
+    report_files = await asyncio.to_thread(_collect_report_files, limit)
+    semaphore = asyncio.Semaphore(REPORT_SCAN_CONCURRENCY)
+
+    async def summarize(report_file: Path, report_type: str) -> dict[str, object] | None:
+        async with semaphore:
+            return await asyncio.to_thread(_try_summarize_report, report_file, report_type)
+
+    summaries = await asyncio.gather(
+        *(summarize(report_file, report_type) for report_file, report_type in report_files)
+    )
+
+    # Drop summaries of deleted/rotated reports so the cache tracks the listing
+    listed = {report_file for report_file, _ in report_files}
+    for stale in _report_summaries.keys() - listed:
+        _report_summaries.pop(stale, None)
+
+    return {"reports": [summary for summary in summaries if summary is not None]}
+
+
+# Resolved once at import; raw report reads must stay under this directory
+REPORTS_ROOT_PREFIX = os.path.realpath(WORKSPACE_ROOT / "reports") + os.sep
 
 
 @app.get("/reports/{report_path:path}/raw")
@@ -357,16 +594,12 @@ def get_report_raw(report_path: str) -> dict[str, object]:
         raise HTTPException(status_code=400, detail="Only JSON reports are supported")
     
     # Security check: ensure path is within reports directory
-    try:
-        report_file.resolve().relative_to((WORKSPACE_ROOT / "reports").resolve())
-    except ValueError:
+    if not os.path.realpath(report_file).startswith(REPORTS_ROOT_PREFIX):
         raise HTTPException(status_code=403, detail="Access denied")
     
     try:
-        with report_file.open("r") as f:
-            data = json.load(f)
-        return data
-    except json.JSONDecodeError:
+        return orjson.loads(report_file.read_bytes())
+    except orjson.JSONDecodeError:
         raise HTTPException(status_code=500, detail="Invalid JSON in report file")
 
 
@@ -378,7 +611,7 @@ def create_run(request: RunCreateRequest) -> dict[str, object]:
         raise HTTPException(status_code=400, detail=f"Config not found: {config_path}")
 
     # Pre-create snapshot so UI can display queued run immediately
-    registry.create_run(
+    snapshot = registry.create_run(
         project_id=request.project_id or config_path.stem,
         config_path=str(config_path),
         params={
@@ -409,26 +642,8 @@ def create_run(request: RunCreateRequest) -> dict[str, object]:
     if request.dry_run:
         cmd.append("--dry-run")
 
-    stdout_path = registry.stdout_path(run_id)
-    env = os.environ.copy()
-    
-    # Open file handle for subprocess (will be inherited and remain open)
-    stdout_handle = stdout_path.open("w", encoding="utf-8", buffering=1)  # Line buffered
-
-    subprocess.Popen(
-        cmd,
-        cwd=str(WORKSPACE_ROOT),
-        stdout=stdout_handle,
-        stderr=stdout_handle,
-        env=env,
-        start_new_session=True,  # Detach from parent process
-        close_fds=False,  # Keep file descriptors open
-    )
-    
-    # Don't close handle - subprocess needs it
-    # Handle will be closed when subprocess finishes
+    _launch_orchestrator(cmd, run_id)
 
-    snapshot = registry.load_snapshot(run_id)
     return {"run": snapshot.to_dict()}
 
 
@@ -446,7 +661,7 @@ def create_deep_research(request: DeepResearchRequest) -> dict[str, object]:
         raise HTTPException(status_code=400, detail=f"Config not found: {config_path}")
     
     # Pre-create snapshot
-    registry.create_run(
+    snapshot = registry.create_run(
         project_id=f"deep-research-{report_path.stem}",
         config_path=str(config_path),
         params={
@@ -480,26 +695,8 @@ def create_deep_research(request: DeepResearchRequest) -> dict[str, object]:
         import json
         cmd.extend(["--companies", json.dumps(request.companies)])
     
-    stdout_path = registry.stdout_path(run_id)
-    env = os.environ.copy()
-    
-    # Open file handle for subprocess (will be inherited and remain open)
-    stdout_handle = stdout_path.open("w", encoding="utf-8", buffering=1)  # Line buffered
-    
-    subprocess.Popen(
-        cmd,
-        cwd=str(WORKSPACE_ROOT),
-        stdout=stdout_handle,
-        stderr=stdout_handle,
-        env=env,
-        start_new_session=True,  # Detach from parent process
-        close_fds=False,  # Keep file descriptors open
-    )
-    
-    # Don't close handle - subprocess needs it
-    # Handle will be closed when subprocess finishes
+    _launch_orchestrator(cmd, run_id)
     
-    snapshot = registry.load_snapshot(run_id)
     return {"run": snapshot.to_dict()}
 
 
@@ -510,17 +707,16 @@ def create_deep_research(request: DeepResearchRequest) -> dict[str, object]:
 @app.get("/projects")
 def list_projects() -> dict[str, list[dict]]:
     """List all research projects."""
-    projects = load_projects()
+    projects = load_projects_cached()
     return {"projects": list(projects.values())}
 
 
 @app.post("/projects", status_code=201)
 def create_project(request: ProjectCreateRequest) -> dict[str, dict]:
     """Create a new research project."""
-    from datetime import datetime
     
     project_id = uuid.uuid4().hex[:12]
-    now = datetime.utcnow().isoformat() + "Z"
+    now = _now_iso()
     
     project = {
         "id": project_id,
@@ -554,7 +750,7 @@ def create_project(request: ProjectCreateRequest) -> dict[str, dict]:
 @app.get("/projects/{project_id}")
 def get_project(project_id: str) -> dict[str, dict]:
     """Get a single project by ID."""
-    projects = load_projects()
+    projects = load_projects_cached()
     if project_id not in projects:
         raise HTTPException(status_code=404, detail="Project not found")
     return {"project": projects[project_id]}
@@ -563,7 +759,6 @@ def get_project(project_id: str) -> dict[str, dict]:
 @app.put("/projects/{project_id}")
 def update_project(project_id: str, request: ProjectUpdateRequest) -> dict[str, dict]:
     """Update a project."""
-    from datetime import datetime
     
     projects = load_projects()
     if project_id not in projects:
@@ -571,22 +766,14 @@ def update_project(project_id: str, request: ProjectUpdateRequest) -> dict[str,
     
     project = projects[project_id]
     
-    if request.client_name is not None:
-        project["client_name"] = request.client_name
-    if request.project_name is not None:
-        project["project_name"] = request.project_name
-    if request.brief is not None:
-        project["brief"] = request.brief.model_dump()
-    if request.framework is not None:
-        project["framework"] = request.framework.model_dump()
-    if request.status is not None:
-        project["status"] = request.status
-    if request.report_path is not None:
-        project["report_path"] = request.report_path
-    if request.stats is not None:
-        project["stats"] = request.stats.model_dump()
-    
-    project["updated_at"] = datetime.utcnow().isoformat() + "Z"
+    # Only fields present in the request body are applied (None still means "leave as is")
+    for field in request.model_fields_set:
+        value = getattr(request, field)
+        if value is None:
+            continue
+        project[field] = value.model_dump() if isinstance(value, BaseModel) else value
+    
+    project["updated_at"] = _now_iso()
     
     projects[project_id] = project
     save_projects(projects)
@@ -610,13 +797,11 @@ def delete_project(project_id: str) -> dict[str, str]:
 @app.post("/projects/{project_id}/enrich-brief")
 async def enrich_project_brief(project_id: str, request: EnrichBriefRequest) -> dict[str, object]:
     """Use GPT to generate clarifying questions based on the research brief."""
-    from openai import AsyncOpenAI
-    
     api_key = os.getenv("OPENAI_API_KEY")
     if not api_key:
         raise HTTPException(status_code=500, detail="OpenAI API key not configured")
     
-    client = AsyncOpenAI(api_key=api_key)
+    client = _get_openai_client(api_key)
     
     prompt = f"""Based on this investment research objective, generate 4-5 clarifying questions to better understand the research scope:
 
@@ -641,7 +826,9 @@ Return as JSON array with this structure:
 """
 
     try:
-        response = await client.chat.completions.create(
+        content = await _coalesced_completion(
+            client,
+            cache=True,
             model="gpt-4o",
             messages=[
                 {"role": "system", "content": "You are an investment research assistant helping to scope research projects."},
@@ -651,7 +838,7 @@ Return as JSON array with this structure:
             max_tokens=800,
         )
         
-        result = json.loads(response.choices[0].message.content or '{"questions": []}')
+        result = orjson.loads(content or EMPTY_QUESTIONS_JSON)
         return {"questions": result.get("questions", result if isinstance(result, list) else [])}
         
     except Exception as e:
@@ -661,13 +848,11 @@ Return as JSON array with this structure:
 @app.post("/projects/{project_id}/generate-framework")
 async def generate_project_framework(project_id: str, request: GenerateFrameworkRequest) -> dict[str, object]:
     """Use GPT to generate investment thesis, KPIs, and value chain segments."""
-    from openai import AsyncOpenAI
-    
     api_key = os.getenv("OPENAI_API_KEY")
     if not api_key:
         raise HTTPException(status_code=500, detail="OpenAI API key not configured")
     
-    client = AsyncOpenAI(api_key=api_key)
+    client = _get_openai_client(api_key)
     
     brief = request.brief
     answers = request.answers
@@ -701,7 +886,8 @@ Return as JSON:
 """
 
     try:
-        response = await client.chat.completions.create(
+        content = await _coalesced_completion(
+            client,
             model="gpt-4o",
             messages=[
                 {"role": "system", "content": "You are an expert investment analyst helping to structure research projects for venture capital and private equity firms."},
@@ -711,14 +897,13 @@ Return as JSON:
             max_tokens=1500,
         )
         
-        result = json.loads(response.choices[0].message.content or "{}")
+        result = orjson.loads(content or EMPTY_JSON_OBJECT)
         
         # Update project with generated framework
         projects = load_projects()
         if project_id in projects:
-            from datetime import datetime
             projects[project_id]["framework"] = result
-            projects[project_id]["updated_at"] = datetime.utcnow().isoformat() + "Z"
+            projects[project_id]["updated_at"] = _now_iso()
             save_projects(projects)
         
         return {"framework": result}
@@ -824,27 +1009,14 @@ def start_project_test_run(project_id: str, request: TestRunRequest) -> dict[str
         project_id,
     ]
     
-    stdout_path = registry.stdout_path(run_id)
-    env = os.environ.copy()
-    
     # Ensure reports directory exists
     (WORKSPACE_ROOT / "reports" / "test_runs" / project_id).mkdir(parents=True, exist_ok=True)
     
-    stdout_handle = stdout_path.open("w", encoding="utf-8", buffering=1)
-    
-    subprocess.Popen(
-        cmd,
-        cwd=str(WORKSPACE_ROOT),
-        stdout=stdout_handle,
-        stderr=stdout_handle,
-        env=env,
-        start_new_session=True,
-        close_fds=False,
-    )
+    _launch_orchestrator(cmd, run_id)
     
     # Update project status
     project["status"] = "test_run"
-    project["updated_at"] = datetime.utcnow().isoformat() + "Z"
+    project["updated_at"] = _now_iso()
     save_projects(projects)
     
     return {
@@ -949,28 +1121,15 @@ def start_project_discovery(project_id: str, request: StartDiscoveryRequest) ->
         project_id,
     ]
     
-    stdout_path = registry.stdout_path(run_id)
-    env = os.environ.copy()
-    
     # Ensure reports directory exists
     (WORKSPACE_ROOT / "reports" / "discoveries" / project_id).mkdir(parents=True, exist_ok=True)
     
-    stdout_handle = stdout_path.open("w", encoding="utf-8", buffering=1)
-    
-    subprocess.Popen(
-        cmd,
-        cwd=str(WORKSPACE_ROOT),
-        stdout=stdout_handle,
-        stderr=stdout_handle,
-        env=env,
-        start_new_session=True,
-        close_fds=False,
-    )
+    _launch_orchestrator(cmd, run_id)
     
     # Update project with run_id and status
     project["status"] = "researching"
     project["current_run_id"] = run_id
-    project["updated_at"] = datetime.utcnow().isoformat() + "Z"
+    project["updated_at"] = _now_iso()
     save_projects(projects)
     
     return {
@@ -1056,28 +1215,15 @@ def retry_project_discovery(project_id: str) -> dict[str, object]:
         project_id,
     ]
     
-    stdout_path = registry.stdout_path(run_id)
-    env = os.environ.copy()
-    
     # Ensure reports directory exists
     (WORKSPACE_ROOT / "reports" / "discoveries" / project_id).mkdir(parents=True, exist_ok=True)
     
-    stdout_handle = stdout_path.open("w", encoding="utf-8", buffering=1)
-    
-    subprocess.Popen(
-        cmd,
-        cwd=str(WORKSPACE_ROOT),
-        stdout=stdout_handle,
-        stderr=stdout_handle,
-        env=env,
-        start_new_session=True,
-        close_fds=False,
-    )
+    _launch_orchestrator(cmd, run_id)
     
     # Update project with new run_id and status
     project["status"] = "researching"
     project["current_run_id"] = run_id
-    project["updated_at"] = datetime.utcnow().isoformat() + "Z"
+    project["updated_at"] = _now_iso()
     save_projects(projects)
     
     return {
@@ -1142,29 +1288,16 @@ def start_project_deep_research(project_id: str, request: StartDeepResearchReque
         project_id,
     ]
     
-    stdout_path = registry.stdout_path(run_id)
-    env = os.environ.copy()
-    
     # Ensure reports directory exists
     deep_research_dir = WORKSPACE_ROOT / "reports" / "deep_research" / project_id
     deep_research_dir.mkdir(parents=True, exist_ok=True)
     
-    stdout_handle = stdout_path.open("w", encoding="utf-8", buffering=1)
-    
-    subprocess.Popen(
-        cmd,
-        cwd=str(WORKSPACE_ROOT),
-        stdout=stdout_handle,
-        stderr=stdout_handle,
-        env=env,
-        start_new_session=True,
-        close_fds=False,
-    )
+    _launch_orchestrator(cmd, run_id)
     
     # Update project with run_id and status
     project["status"] = "deep_researching"
     project["current_run_id"] = run_id
-    project["updated_at"] = datetime.utcnow().isoformat() + "Z"
+    project["updated_at"] = _now_iso()
     save_projects(projects)
     
     return {
@@ -1179,7 +1312,7 @@ def start_project_deep_research(project_id: str, request: StartDeepResearchReque
 def get_discovery_status(project_id: str) -> dict[str, object]:
     """Get current discovery run status for a project."""
     
-    projects = load_projects()
+    projects = load_projects_cached()
     if project_id not in projects:
         raise HTTPException(status_code=404, detail="Project not found")
     
@@ -1212,26 +1345,31 @@ def get_discovery_status(project_id: str) -> dict[str, object]:
     
     # Extract error info from last event if failed
     error_message = None
+    updates: dict[str, object] = {}
     if run_data.get("status") == "failed":
         last_event = run_data.get("last_event", {})
         error_message = last_event.get("error", "Discovery failed unexpectedly")
         # Update project status to allow retry
         if project.get("status") == "researching":
-            project["status"] = "discovery_failed"
-            project["updated_at"] = datetime.utcnow().isoformat() + "Z"
-            save_projects(projects)
+            updates["status"] = "discovery_failed"
     
     # If completed, update project status
     if run_data.get("status") == "completed" and has_report:
         # Check if this is discovery or deep research
         params = run_data.get("params", {})
         if params.get("deep_research"):
-            project["status"] = "ready_for_review"
+            updates["status"] = "ready_for_review"
         else:
-            project["status"] = "discovery_complete"
-        project["report_path"] = str(report_path.relative_to(WORKSPACE_ROOT))
-        project["updated_at"] = datetime.utcnow().isoformat() + "Z"
-        save_projects(projects)
+            updates["status"] = "discovery_complete"
+        updates["report_path"] = str(report_path.relative_to(WORKSPACE_ROOT))
+    
+    # This endpoint is polled, so only rewrite projects.json on an actual transition
+    if any(project.get(key) != value for key, value in updates.items()):
+        projects = load_projects()
+        if project_id in projects:
+            projects[project_id].update(updates)
+            projects[project_id]["updated_at"] = _now_iso()
+            save_projects(projects)
     
     # Extract cost data from run
     total_cost = run_data.get("total_cost", 0.0)
@@ -1261,7 +1399,7 @@ def get_discovery_status(project_id: str) -> dict[str, object]:
 def get_project_cost(project_id: str) -> dict[str, object]:
     """Get cost breakdown for a project including all runs."""
     
-    projects = load_projects()
+    projects = load_projects_cached()
     if project_id not in projects:
         raise HTTPException(status_code=404, detail="Project not found")
     
@@ -1315,7 +1453,7 @@ def get_project_cost(project_id: str) -> dict[str, object]:
         "enrichment_cost": round(enrichment_cost, 4),
         "currency": "USD",
         "runs": run_costs,
-        "last_updated": datetime.utcnow().isoformat() + "Z",
+        "last_updated": _now_iso(),
     }
 
 
@@ -1377,7 +1515,6 @@ def get_test_run_results(project_id: str) -> dict[str, object]:
 @app.post("/projects/{project_id}/approve-test-run")
 def approve_project_test_run(project_id: str) -> dict[str, object]:
     """Approve test run and start full research."""
-    from datetime import datetime
     
     projects = load_projects()
     if project_id not in projects:
@@ -1390,7 +1527,7 @@ def approve_project_test_run(project_id: str) -> dict[str, object]:
     
     # Update project status
     project["status"] = "researching"
-    project["updated_at"] = datetime.utcnow().isoformat() + "Z"
+    project["updated_at"] = _now_iso()
     save_projects(projects)
     
     # In production, this would launch the full research run
@@ -1413,13 +1550,11 @@ async def enrich_company(request: EnrichRequest) -> dict[str, object]:
     This endpoint uses the OpenAI API to fetch missing company information
     like website, team details, financials, etc.
     """
-    from openai import AsyncOpenAI
-    
     api_key = os.getenv("OPENAI_API_KEY")
     if not api_key:
         raise HTTPException(status_code=500, detail="OpenAI API key not configured")
     
-    client = AsyncOpenAI(api_key=api_key)
+    client = _get_openai_client(api_key)
     
     # Build the enrichment prompt
     fields_needed = request.fields_to_enrich or ["website", "team", "financials"]
@@ -1446,7 +1581,9 @@ Return the information in JSON format with these keys (only include fields you h
 """
     
     try:
-        response = await client.chat.completions.create(
+        content = await _coalesced_completion(
+            client,
+            cache=True,
             model="gpt-4o",
             messages=[
                 {
@@ -1459,7 +1596,7 @@ Return the information in JSON format with these keys (only include fields you h
             max_tokens=500,
         )
         
-        result = json.loads(response.choices[0].message.content or "{}")
+        result = orjson.loads(content or EMPTY_JSON_OBJECT)
         return result
         
     except Exception as e:
@@ -1483,13 +1620,11 @@ async def enrich_company_data(request: EnrichCompanyDataRequest) -> dict[str, ob
     - key_clients: Notable customers/clients
     - kpi_alignment: Alignment with investment KPIs
     """
-    from openai import AsyncOpenAI
-    
     api_key = os.getenv("OPENAI_API_KEY")
     if not api_key:
         raise HTTPException(status_code=500, detail="OpenAI API key not configured")
     
-    client = AsyncOpenAI(api_key=api_key)
+    client = _get_openai_client(api_key)
     
     company_name = request.company_name
     current_data = request.current_data
@@ -1576,7 +1711,8 @@ IMPORTANT:
 """
 
     try:
-        response = await client.chat.completions.create(
+        content = await _coalesced_completion(
+            client,
             model="gpt-4o",
             messages=[
                 {
@@ -1593,7 +1729,7 @@ Return well-structured JSON that matches the expected schema exactly."""
             temperature=0.3,  # Lower temperature for more factual responses
         )
         
-        result = json.loads(response.choices[0].message.content or "{}")
+        result = orjson.loads(content or EMPTY_JSON_OBJECT)
         
         # Post-process funding_rounds to ensure numeric amounts
         if "funding_rounds" in result:
@@ -1679,14 +1815,12 @@ async def stream_chat_response(
     messages: list[dict],
 ) -> AsyncGenerator[str, None]:
     """Stream chat response from GPT-5.1."""
-    from openai import AsyncOpenAI
-    
     api_key = os.getenv("OPENAI_API_KEY")
     if not api_key:
         yield f"data: {json.dumps({'error': 'OpenAI API key not configured'})}\n\n"
         return
     
-    client = AsyncOpenAI(api_key=api_key)
+    client = _get_openai_client(api_key)
     
     try:
         # Use GPT-5.1 with streaming
@@ -1884,7 +2018,7 @@ def save_project_chat(project_id: str, request: SaveChatRequest) -> dict:
         "project_id": project_id,
         "messages": request.messages,
         "artifacts": request.artifacts,
-        "updated_at": datetime.utcnow().isoformat() + "Z",
+        "updated_at": _now_iso(),
     }
     
     with chat_file.open("w") as f:
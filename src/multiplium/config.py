@@ -18,6 +18,11 @@ class ProviderConfig(BaseModel):
         description="Maximum autonomous tool iterations before forcing a response.",
     )
     retry_limit: int = Field(default=3, description="Max retries on transient SDK errors.")
+    # Gemini 3 with thinking mode can take 8-10 minutes per segment × 8 segments = ~80 minutes
+    timeout_seconds: float = Field(
+        default=5400.0,
+        description="Wall-clock budget for one discovery run, counted once the provider starts.",
+    )
     api_key: Optional[SecretStr] = None
     
     # Tool usage limits (moved from hardcoded values in providers)
@@ -3,6 +3,7 @@ from __future__ import annotations
 
 import os
 import sys
+from collections.abc import Mapping
 from typing import Any
 
 import structlog
@@ -14,81 +15,59 @@ class ConfigValidationError(Exception):
     """Raised when critical configuration is missing or invalid."""
 
 
-def validate_provider_keys(settings: Any) -> dict[str, list[str]]:
+# Provider name -> accepted API key env vars (any one of them is enough)
+PROVIDER_API_KEYS: tuple[tuple[str, tuple[str, ...]], ...] = (
+    ("anthropic", ("ANTHROPIC_API_KEY",)),
+    ("openai", ("OPENAI_API_KEY",)),
+    # Google/Gemini (multiple possible env vars)
+    ("google", ("GOOGLE_GENAI_API_KEY", "GOOGLE_API_KEY", "GEMINI_API_KEY")),
+    # xAI (optional 4th provider)
+    ("xai", ("XAI_API_KEY",)),
+)
+
+
+def validate_provider_keys(
+    settings: Any,
+    env: Mapping[str, str] | None = None,
+) -> dict[str, list[str]]:
     """
     Validate that required API keys are present for enabled providers.
     
-    Returns a dict mapping provider names to lists of missing keys.
+    Reads ``env`` (default: the live os.environ). Returns a dict mapping
+    provider names to lists of missing keys.
     """
+    if env is None:
+        env = os.environ
     missing: dict[str, list[str]] = {}
     
-    # Check Anthropic
-    anthropic_config = settings.providers.get("anthropic")
-    if anthropic_config and anthropic_config.enabled:
-        if not os.getenv("ANTHROPIC_API_KEY"):
-            missing["anthropic"] = ["ANTHROPIC_API_KEY"]
-            log.warning(
-                "provider.key_missing",
-                provider="anthropic",
-                keys=missing["anthropic"],
-                impact="Provider will be skipped",
-            )
-    
-    # Check OpenAI
-    openai_config = settings.providers.get("openai")
-    if openai_config and openai_config.enabled:
-        if not os.getenv("OPENAI_API_KEY"):
-            missing["openai"] = ["OPENAI_API_KEY"]
-            log.warning(
-                "provider.key_missing",
-                provider="openai",
-                keys=missing["openai"],
-                impact="Provider will be skipped",
-            )
-    
-    # Check Google/Gemini (multiple possible env vars)
-    google_config = settings.providers.get("google")
-    if google_config and google_config.enabled:
-        google_key = (
-            os.getenv("GOOGLE_GENAI_API_KEY")
-            or os.getenv("GOOGLE_API_KEY")
-            or os.getenv("GEMINI_API_KEY")
-        )
-        if not google_key:
-            missing["google"] = [
-                "GOOGLE_GENAI_API_KEY or GOOGLE_API_KEY or GEMINI_API_KEY"
-            ]
-            log.warning(
-                "provider.key_missing",
-                provider="google",
-                keys=missing["google"],
-                impact="Provider will be skipped",
-            )
-    
-    # Check xAI (optional 4th provider)
-    xai_config = settings.providers.get("xai")
-    if xai_config and xai_config.enabled:
-        if not os.getenv("XAI_API_KEY"):
-            missing["xai"] = ["XAI_API_KEY"]
+    for provider_name, env_keys in PROVIDER_API_KEYS:
+        provider_config = settings.providers.get(provider_name)
+        if not (provider_config and provider_config.enabled):
+            continue
+        if not any(env.get(key) for key in env_keys):
+            missing[provider_name] = [" or ".join(env_keys)]
             log.warning(
                 "provider.key_missing",
-                provider="xai",
-                keys=missing["xai"],
+                provider=provider_name,
+                keys=missing[provider_name],
                 impact="Provider will be skipped",
             )
     
     return missing
 
 
-def validate_search_apis() -> dict[str, bool]:
+def validate_search_apis(env: Mapping[str, str] | None = None) -> dict[str, bool]:
     """
     Check availability of search API keys.
     
-    Returns dict mapping API names to availability status.
+    Reads ``env`` (default: the live os.environ). Returns dict mapping API
+    names to availability status.
     """
+    if env is None:
+        env = os.environ
     availability = {
-        "tavily": bool(os.getenv("TAVILY_API_KEY")),
-        "perplexity": bool(os.getenv("PERPLEXITY_API_KEY")),
+        "tavily": bool(env.get("TAVILY_API_KEY")),
+        "perplexity": bool(env.get("PERPLEXITY_API_KEY")),
     }
     
     if not any(availability.values()):
@@ -104,11 +83,13 @@ def validate_search_apis() -> dict[str, bool]:
     return availability
 
 
-def validate_optional_tools() -> dict[str, bool]:
-    """Check availability of optional tool API keys."""
+def validate_optional_tools(env: Mapping[str, str] | None = None) -> dict[str, bool]:
+    """Check availability of optional tool API keys in ``env`` (default: os.environ)."""
+    if env is None:
+        env = os.environ
     availability = {
-        "financial_modeling_prep": bool(os.getenv("FMP_API_KEY")),
-        "crunchbase": bool(os.getenv("CRUNCHBASE_API_KEY")),
+        "financial_modeling_prep": bool(env.get("FMP_API_KEY")),
+        "crunchbase": bool(env.get("CRUNCHBASE_API_KEY")),
     }
     
     if not availability["financial_modeling_prep"]:
@@ -130,12 +111,15 @@ def validate_all_on_startup(settings: Any) -> None:
     """
     log.info("config.validation_start", message="Validating environment configuration")
     
+    # os.environ is already a Mapping; read it live rather than copying it
+    env = os.environ
+    
     # Validate provider keys
-    missing_provider_keys = validate_provider_keys(settings)
+    missing_provider_keys = validate_provider_keys(settings, env)
     
     # Count enabled providers with valid keys
     enabled_count = 0
-    for provider_name in ["anthropic", "openai", "google", "xai"]:
+    for provider_name, _ in PROVIDER_API_KEYS:
         provider_config = settings.providers.get(provider_name)
         if provider_config and provider_config.enabled:
             if provider_name not in missing_provider_keys:
@@ -152,14 +136,14 @@ def validate_all_on_startup(settings: Any) -> None:
     log.info(
         "config.providers_ready",
         enabled_count=enabled_count,
-        total_configured=4,
+        total_configured=len(PROVIDER_API_KEYS),
     )
     
     # Validate search APIs (optional but recommended)
-    validate_search_apis()
+    validate_search_apis(env)
     
     # Validate optional tools
-    validate_optional_tools()
+    validate_optional_tools(env)
     
     log.info("config.validation_complete", message="Configuration validation passed")
 
@@ -1,9 +1,21 @@
 """Quantitative impact scoring system for investment analysis."""
 from __future__ import annotations
 
+import re
 from dataclasses import dataclass
+from itertools import groupby
 from typing import Any
 
+# Percentages in KPI text, e.g. "20%", "20 percent", "20-30%"
+_PERCENT_RE = re.compile(r"(\d+(?:\.\d+)?)\s*(?:%|percent)", re.IGNORECASE)
+
+# Financial viability indicators, matched at word starts in the lowercased
+# summary (so "scaled" counts as "scale" but "unfunded" is not "funded")
+_FINANCIAL_FUNDING_RE = re.compile(r"\b(?:profitable|revenue|funded|series|raised)")
+_FINANCIAL_GROWTH_RE = re.compile(r"\b(?:growing|scale|expansion)")
+_FINANCIAL_TRACTION_RE = re.compile(r"\b(?:deployed|commercial|customers)")
+_FINANCIAL_EARLY_STAGE_RE = re.compile(r"\b(?:pre-revenue|pilot|prototype)")
+
 
 @dataclass
 class ImpactScore:
@@ -67,6 +79,46 @@ class ImpactScorer:
     TIER_2_WEIGHT = 0.7  # Reputable media, industry reports
     TIER_3_WEIGHT = 0.3  # Vendor materials, self-published
     
+    # (keyword, weight) pairs per dimension, matched against lowercased text
+    ENVIRONMENTAL_KEYWORDS = (
+        ("soil carbon", 0.2),
+        ("carbon sequestration", 0.2),
+        ("water", 0.15),
+        ("emissions", 0.15),
+        ("pesticide reduction", 0.15),
+        ("biodiversity", 0.1),
+        ("renewable", 0.05),
+    )
+    SOCIAL_KEYWORDS = (
+        ("employment", 0.2),
+        ("community", 0.15),
+        ("health", 0.15),
+        ("education", 0.15),
+        ("gender", 0.1),
+        ("inclusion", 0.1),
+        ("fair trade", 0.15),
+    )
+    GOVERNANCE_KEYWORDS = (
+        ("tier 1", 0.3),
+        ("peer-reviewed", 0.25),
+        ("certified", 0.15),
+        ("b corp", 0.15),
+        ("transparent", 0.1),
+        ("audit", 0.05),
+    )
+    BIODIVERSITY_KEYWORDS = ("biodiversity", "beneficial insects", "native species")
+    # (SDG number, keywords) in ascending SDG order
+    SDG_KEYWORDS = (
+        (2, ("hunger", "food", "agriculture")),
+        (3, ("health",)),
+        (6, ("water",)),
+        (7, ("energy",)),
+        (8, ("employment", "jobs")),
+        (12, ("consumption", "circular")),
+        (13, ("climate", "carbon")),
+        (15, ("land", "biodiversity", "soil")),
+    )
+    
     def score_company(self, company_data: dict[str, Any]) -> ImpactScore:
         """
         Score a company based on research findings.
@@ -83,17 +135,23 @@ class ImpactScorer:
         sources = company_data.get("sources", [])
         summary = company_data.get("summary", "")
         
+        # Join and lowercase once; every heuristic below matches against these
+        kpi_text = " ".join(kpi_alignment)
+        kpi_lower = kpi_text.lower()
+        summary_lower = summary.lower()
+        text_lower = kpi_lower + " " + summary_lower
+        
         # Score each dimension
-        env_score = self._score_environmental(kpi_alignment, summary)
-        social_score = self._score_social(kpi_alignment, summary)
-        gov_score = self._score_governance(kpi_alignment, summary)
-        financial_score = self._score_financial(company_data)
+        env_score = self._score_environmental(text_lower)
+        social_score = self._score_social(text_lower)
+        gov_score = self._score_governance(text_lower)
+        financial_score = self._score_financial(summary_lower)
         
         # Calculate confidence based on evidence tiers
-        tier_breakdown, confidence = self._assess_evidence_quality(sources, kpi_alignment)
+        tier_breakdown, confidence = self._assess_evidence_quality(sources, kpi_lower)
         
         # Extract SDG alignment
-        sdg_list = self._extract_sdgs(company_data)
+        sdg_list = self._extract_sdgs(company_data, text_lower)
         
         # Calculate weighted overall score
         overall = (
@@ -104,13 +162,10 @@ class ImpactScorer:
         )
         
         # Extract detailed metrics
-        carbon_reduction = self._extract_metric(kpi_alignment, ["carbon", "co2", "emissions"])
-        water_savings = self._extract_metric(kpi_alignment, ["water"])
-        pesticide_reduction = self._extract_metric(kpi_alignment, ["pesticide", "chemical"])
-        biodiversity = any(
-            word in " ".join(kpi_alignment).lower() 
-            for word in ["biodiversity", "beneficial insects", "native species"]
-        )
+        carbon_reduction = self._extract_metric(kpi_text, kpi_lower, ["carbon", "co2", "emissions"])
+        water_savings = self._extract_metric(kpi_text, kpi_lower, ["water"])
+        pesticide_reduction = self._extract_metric(kpi_text, kpi_lower, ["pesticide", "chemical"])
+        biodiversity = any(word in kpi_lower for word in self.BIODIVERSITY_KEYWORDS)
         
         return ImpactScore(
             environmental=env_score,
@@ -128,93 +183,59 @@ class ImpactScorer:
             certifications=company_data.get("certifications"),
         )
     
-    def _score_environmental(self, kpi_alignment: list[str], summary: str) -> float:
-        """Score environmental impact (0-1)."""
-        env_keywords = {
-            "soil carbon": 0.2,
-            "carbon sequestration": 0.2,
-            "water": 0.15,
-            "emissions": 0.15,
-            "pesticide reduction": 0.15,
-            "biodiversity": 0.1,
-            "renewable": 0.05,
-        }
-        
-        text = " ".join(kpi_alignment).lower() + " " + summary.lower()
+    def _score_environmental(self, text_lower: str) -> float:
+        """Score environmental impact (0-1) from lowercased KPI + summary text."""
         score = 0.0
         
-        for keyword, weight in env_keywords.items():
-            if keyword in text:
+        for keyword, weight in self.ENVIRONMENTAL_KEYWORDS:
+            if keyword in text_lower:
                 score += weight
         
         return min(score, 1.0)
     
-    def _score_social(self, kpi_alignment: list[str], summary: str) -> float:
-        """Score social impact (0-1)."""
-        social_keywords = {
-            "employment": 0.2,
-            "community": 0.15,
-            "health": 0.15,
-            "education": 0.15,
-            "gender": 0.1,
-            "inclusion": 0.1,
-            "fair trade": 0.15,
-        }
-        
-        text = " ".join(kpi_alignment).lower() + " " + summary.lower()
+    def _score_social(self, text_lower: str) -> float:
+        """Score social impact (0-1) from lowercased KPI + summary text."""
         score = 0.0
         
-        for keyword, weight in social_keywords.items():
-            if keyword in text:
+        for keyword, weight in self.SOCIAL_KEYWORDS:
+            if keyword in text_lower:
                 score += weight
         
         return min(score, 1.0)
     
-    def _score_governance(self, kpi_alignment: list[str], summary: str) -> float:
-        """Score governance/transparency (0-1)."""
-        gov_keywords = {
-            "tier 1": 0.3,
-            "peer-reviewed": 0.25,
-            "certified": 0.15,
-            "b corp": 0.15,
-            "transparent": 0.1,
-            "audit": 0.05,
-        }
-        
-        text = " ".join(kpi_alignment).lower() + " " + summary.lower()
+    def _score_governance(self, text_lower: str) -> float:
+        """Score governance/transparency (0-1) from lowercased KPI + summary text."""
         score = 0.3  # Base score for having any documented evidence
         
-        for keyword, weight in gov_keywords.items():
-            if keyword in text:
+        for keyword, weight in self.GOVERNANCE_KEYWORDS:
+            if keyword in text_lower:
                 score += weight
         
         return min(score, 1.0)
     
-    def _score_financial(self, company_data: dict[str, Any]) -> float:
-        """Score financial viability (0-1)."""
+    def _score_financial(self, summary: str) -> float:
+        """Score financial viability (0-1) from the lowercased summary."""
         # This is a simplified heuristic
         # In production, integrate actual financial data
         
-        summary = company_data.get("summary", "").lower()
-        
         score = 0.5  # Base assumption
         
         # Positive indicators
-        if any(word in summary for word in ["profitable", "revenue", "funded", "Series", "raised"]):
+        if _FINANCIAL_FUNDING_RE.search(summary):
             score += 0.2
-        if any(word in summary for word in ["growing", "scale", "expansion"]):
+        if _FINANCIAL_GROWTH_RE.search(summary):
             score += 0.15
-        if any(word in summary for word in ["deployed", "commercial", "customers"]):
+        if _FINANCIAL_TRACTION_RE.search(summary):
             score += 0.15
         
         # Negative indicators
-        if any(word in summary for word in ["pre-revenue", "pilot", "prototype"]):
+        if _FINANCIAL_EARLY_STAGE_RE.search(summary):
             score -= 0.2
         
         return min(max(score, 0.0), 1.0)
     
     def _assess_evidence_quality(
-        self, sources: list[str], kpi_alignment: list[str]
+        self, sources: list[str], kpi_lower: str
     ) -> tuple[dict[str, int], float]:
         """
         Assess evidence quality and calculate confidence score.
@@ -225,8 +246,8 @@ class ImpactScorer:
         """
         tier_breakdown = {"tier_1": 0, "tier_2": 0, "tier_3": 0}
         
-        # Check for tier markers in KPI alignment text
-        text = " ".join(kpi_alignment).lower()
+        # Check for tier markers in (lowercased) KPI alignment text
+        text = kpi_lower
         
         # Tier 1 indicators
         tier1_markers = ["peer-reviewed", "university", "regulatory", "iso", "certified"]
@@ -257,54 +278,37 @@ class ImpactScorer:
         
         return tier_breakdown, confidence
     
-    def _extract_sdgs(self, company_data: dict[str, Any]) -> list[int]:
-        """Extract SDG alignment numbers from company data."""
+    def _extract_sdgs(self, company_data: dict[str, Any], text: str) -> list[int]:
+        """Extract SDG alignment numbers from company data and its lowercased text."""
         # Check if SDG data is already available
         if "sdg_alignment" in company_data:
             return company_data["sdg_alignment"]
         
-        # Otherwise, do keyword-based heuristic
-        summary = company_data.get("summary", "").lower()
-        kpi_text = " ".join(company_data.get("kpi_alignment", [])).lower()
-        text = summary + " " + kpi_text
-        
-        sdgs = []
-        if "hunger" in text or "food" in text or "agriculture" in text:
-            sdgs.append(2)
-        if "health" in text:
-            sdgs.append(3)
-        if "water" in text:
-            sdgs.append(6)
-        if "energy" in text:
-            sdgs.append(7)
-        if "employment" in text or "jobs" in text:
-            sdgs.append(8)
-        if "consumption" in text or "circular" in text:
-            sdgs.append(12)
-        if "climate" in text or "carbon" in text:
-            sdgs.append(13)
-        if "land" in text or "biodiversity" in text or "soil" in text:
-            sdgs.append(15)
-        
-        return sorted(set(sdgs))
+        # Otherwise, do keyword-based heuristic; table order keeps the result
+        # sorted and each SDG appears once
+        return [
+            sdg
+            for sdg, keywords in self.SDG_KEYWORDS
+            if any(keyword in text for keyword in keywords)
+        ]
     
-    def _extract_metric(self, kpi_alignment: list[str], keywords: list[str]) -> float | None:
+    def _extract_metric(
+        self, kpi_text: str, kpi_lower: str, keywords: list[str]
+    ) -> float | None:
         """Extract quantitative metric from KPI alignment text."""
-        text = " ".join(kpi_alignment)
-        
-        for keyword in keywords:
-            if keyword in text.lower():
-                # Try to find percentage or number near the keyword
-                import re
-                # Look for patterns like "20%", "20 percent", "20-30%"
-                pattern = r"(\d+(?:\.\d+)?)\s*(?:%|percent)"
-                matches = re.findall(pattern, text, re.IGNORECASE)
-                if matches:
-                    return float(matches[0])
+        if any(keyword in kpi_lower for keyword in keywords):
+            # Try to find percentage or number near the keyword
+            match = _PERCENT_RE.search(kpi_text)
+            if match:
+                return float(match.group(1))
         
         return None
 
 
+# ImpactScorer is stateless, so one shared instance serves every call
+_DEFAULT_SCORER = ImpactScorer()
+
+
 def calculate_pareto_frontier(
     companies: list[dict[str, Any]],
     impact_weight: float = 0.6,
@@ -314,44 +318,61 @@ def calculate_pareto_frontier(
     Calculate Pareto frontier for impact vs financial performance.
     
     Args:
-        companies: List of company dicts with impact scores
+        companies: List of company dicts; an existing ``impact_score`` is reused
         impact_weight: Weight for impact dimension (0-1)
         financial_weight: Weight for financial dimension (0-1)
     
     Returns:
         List of companies on the Pareto frontier (optimal trade-offs)
     """
-    scorer = ImpactScorer()
     scored_companies = []
     
     for company in companies:
-        score = scorer.score_company(company)
+        # Re-ranking with new weights only changes the composite, so reuse
+        # dimension scores from a previous pass instead of re-scoring
+        impact_score = company.get("impact_score")
+        if (
+            isinstance(impact_score, dict)
+            and "overall_impact" in impact_score
+            and "financial_viability" in impact_score
+        ):
+            overall = impact_score["overall_impact"]
+            financial = impact_score["financial_viability"]
+        else:
+            score = _DEFAULT_SCORER.score_company(company)
+            impact_score = score.to_dict()
+            overall = score.overall_impact
+            financial = score.financial_viability
         scored_companies.append({
             **company,
-            "impact_score": score.to_dict(),
-            "composite_score": (
-                score.overall_impact * impact_weight
-                + score.financial_viability * financial_weight
-            ),
+            "impact_score": impact_score,
+            "composite_score": overall * impact_weight + financial * financial_weight,
         })
     
     # Sort by composite score
     scored_companies.sort(key=lambda x: x["composite_score"], reverse=True)
     
-    # Find Pareto-optimal companies (not dominated on both dimensions)
-    pareto_frontier = []
-    for candidate in scored_companies:
-        dominated = False
-        for other in scored_companies:
-            if (
-                other["impact_score"]["overall_impact"] > candidate["impact_score"]["overall_impact"]
-                and other["impact_score"]["financial_viability"] > candidate["impact_score"]["financial_viability"]
-            ):
-                dominated = True
-                break
-        
-        if not dominated:
-            pareto_frontier.append(candidate)
+    # Find Pareto-optimal companies (not dominated on both dimensions).
+    # Sweep in descending impact order: a company is dominated iff a company
+    # with strictly higher impact has strictly higher financial viability,
+    # i.e. iff its financial score is below the best seen in earlier groups.
+    by_impact = sorted(
+        scored_companies,
+        key=lambda x: x["impact_score"]["overall_impact"],
+        reverse=True,
+    )
+    dominated_ids: set[int] = set()
+    best_financial = float("-inf")
+    for _, group in groupby(by_impact, key=lambda x: x["impact_score"]["overall_impact"]):
+        group = list(group)
+        group_best = best_financial
+        for candidate in group:
+            financial = candidate["impact_score"]["financial_viability"]
+            if financial < best_financial:
+                dominated_ids.add(id(candidate))
+            group_best = max(group_best, financial)
+        best_financial = group_best
     
-    return pareto_frontier
+    # Keep composite-score order
+    return [c for c in scored_companies if id(c) not in dominated_ids]
 
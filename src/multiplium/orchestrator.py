@@ -1,39 +1,68 @@
 from __future__ import annotations
 
 import asyncio
-from dataclasses import dataclass
+import heapq
+import os
+import re
+import time
+from collections.abc import Awaitable, Callable, Iterator
+from dataclasses import dataclass, replace
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Callable
+from typing import TYPE_CHECKING, Any
 
 import structlog
 import typer
 
 from multiplium.config import Settings, load_settings
 from multiplium.config_validator import ConfigValidationError, validate_all_on_startup
-from multiplium.providers import ProviderFactory, ProviderRunResult
-from multiplium.reporting import write_report
-from multiplium.runs import RunRegistry
-from multiplium.tools.manager import ToolManager
+
+if TYPE_CHECKING:
+    # Providers pull in the vendor SDKs; import them lazily so `--help` and
+    # config-error exits don't pay for them. The run registry is only needed
+    # by the entry points that create one.
+    from multiplium.providers import ProviderRunResult
+    from multiplium.runs import RunRegistry
+    from multiplium.tools.manager import ToolManager
+
+# KEY=value lines of a .env file; commented lines are skipped
+_DOTENV_RE = re.compile(r"^(?![ \t]*#)[ \t]*([^=\s][^=\n]*?)[ \t]*=(.*)$", re.MULTILINE)
 
 # Load .env file explicitly to ensure API keys are available
 # This must happen before any provider initialization
-try:
-    from dotenv import load_dotenv
-    # Load from project root (two levels up from this file)
-    env_path = Path(__file__).resolve().parents[2] / ".env"
-    if env_path.exists():
-        load_dotenv(env_path)
-        structlog.get_logger().debug("orchestrator.env_loaded", path=str(env_path))
-except ImportError:
-    # Fallback: manually load .env if python-dotenv not installed
-    env_path = Path(__file__).resolve().parents[2] / ".env"
-    if env_path.exists():
-        import os
-        for line in env_path.read_text().splitlines():
-            if line and not line.startswith("#") and "=" in line:
-                key, value = line.split("=", 1)
-                os.environ[key.strip()] = value.strip().strip('"').strip("'")
-        structlog.get_logger().debug("orchestrator.env_loaded_manual", path=str(env_path))
+# (once per process: importlib.reload keeps module globals, so it skips this)
+if not globals().get("_ENV_LOADED"):
+    try:
+        from dotenv import load_dotenv
+        # Load from project root (two levels up from this file)
+        env_path = Path(__file__).resolve().parents[2] / ".env"
+        if env_path.exists():
+            load_dotenv(env_path)
+            structlog.get_logger().debug("orchestrator.env_loaded", path=str(env_path))
+    except ImportError:
+        # Fallback: manually load .env if python-dotenv not installed
+        env_path = Path(__file__).resolve().parents[2] / ".env"
+        if env_path.exists():
+            env_text = env_path.read_text()
+            os.environ.update(
+                {
+                    match.group(1): match.group(2).strip().strip('"').strip("'")
+                    for match in _DOTENV_RE.finditer(env_text)
+                }
+            )
+            structlog.get_logger().debug("orchestrator.env_loaded_manual", path=str(env_path))
+    _ENV_LOADED = True
+
+# Progress updates are written when they move this many points or this long has passed
+PROGRESS_MIN_STEP = 0.5
+PROGRESS_MIN_INTERVAL_SECONDS = 1.0
+
+# Max segments validated at once; each segment makes several MCP tool calls
+VALIDATION_CONCURRENCY = 5
+
+# Status of a provider result whose discovery succeeded but whose validation
+# raised; its companies are unvalidated and are kept out of deep research
+VALIDATION_FAILED_STATUS = "validation_failed"
 
 cli = typer.Typer(context_settings={"help_option_names": ["-h", "--help"]})
 log = structlog.get_logger()
@@ -48,10 +77,27 @@ class AgentContext:
     kpis: dict[str, list[str]]
 
 
+@lru_cache(maxsize=32)
+def _read_cached(path: Path, mtime_ns: int, size: int) -> str:
+    """Read a context file; the (mtime, size) key makes edits miss the cache."""
+    return path.read_text(encoding="utf-8")
+
+
+def _read_context_file(path: Path) -> str:
+    stat = path.stat()
+    return _read_cached(path, stat.st_mtime_ns, stat.st_size)
+
+
 async def _load_context(settings: Settings) -> AgentContext:
-    thesis_text = settings.orchestrator.thesis_path.read_text(encoding="utf-8")
-    value_chain_data = settings.orchestrator.value_chain_path.read_text(encoding="utf-8")
-    kpi_data = settings.orchestrator.kpi_path.read_text(encoding="utf-8")
+    # Read the three context files concurrently off the event loop; unchanged
+    # files are served from memory on repeat runs in the same process
+    orchestrator = settings.orchestrator
+    thesis_text, value_chain_data, kpi_data = await asyncio.gather(
+        *(
+            asyncio.to_thread(_read_context_file, path)
+            for path in (orchestrator.thesis_path, orchestrator.value_chain_path, orchestrator.kpi_path)
+        )
+    )
 
     # TODO: replace with structured loaders (likely YAML/JSON)
     return AgentContext(
@@ -64,239 +110,349 @@ async def _load_context(settings: Settings) -> AgentContext:
 async def _run_agents(
     context: AgentContext,
     settings: Settings,
+    tool_manager: ToolManager,
     *,
     registry: RunRegistry | None = None,
     run_id: str | None = None,
+    on_result: Callable[[ProviderRunResult], Awaitable[ProviderRunResult]] | None = None,
+    on_discovery_complete: Callable[[], None] | None = None,
 ) -> list[ProviderRunResult]:
-    tool_manager = ToolManager.from_settings(
-        settings.tools,
-        dry_run=settings.orchestrator.dry_run,
-    )
+    """Run every active provider and return their results in provider order.
+
+    ``on_result`` post-processes each result as soon as its provider finishes
+    (outside the concurrency slot), so later phases overlap with providers
+    that are still running. If it raises, the result comes back with status
+    ``VALIDATION_FAILED_STATUS`` instead of cancelling the other providers.
+    ``on_discovery_complete`` is called once every provider has finished
+    discovery, possibly while some ``on_result`` calls are still running.
+    """
+    from multiplium.providers import ProviderFactory, ProviderRunResult
+
     provider_factory = ProviderFactory(tool_manager=tool_manager, settings=settings)
 
-    try:
-        agents = list(provider_factory.iter_active_agents())
-        if registry and run_id:
-            registry.register_providers(run_id, [name for name, _ in agents])
+    agents = list(provider_factory.iter_active_agents())
+    if registry and run_id:
+        registry.register_providers(run_id, [name for name, _ in agents])
 
-        tasks: list[asyncio.Task[ProviderRunResult]] = []
+    # At most `concurrency` providers run at once; the rest wait their turn
+    semaphore = asyncio.Semaphore(max(1, settings.orchestrator.concurrency))
 
-        async def _run_single_provider(name: str, provider) -> ProviderRunResult:
+    async def _run_single_provider(name: str, provider) -> ProviderRunResult:
+        # Bind provider context once for every event this run logs
+        plog = log.bind(provider=name, model=provider.config.model)
+        if registry and run_id:
+            registry.set_provider_status(
+                run_id,
+                name,
+                status="running",
+                progress=5.0,
+                message="Discovery started",
+            )
+        # Top-level timeout for each provider, tunable per provider config
+        timeout_seconds = provider.config.timeout_seconds
+        plog.info("agent.scheduled", timeout_seconds=timeout_seconds)
+        try:
+            async with asyncio.timeout(timeout_seconds):
+                result = await provider.run_with_retry(context)
+        except TimeoutError:
+            plog.error("provider.timeout", timeout_seconds=timeout_seconds)
+            timeout_message = f"Provider timed out after {timeout_seconds / 60:g} minutes"
             if registry and run_id:
                 registry.set_provider_status(
                     run_id,
                     name,
-                    status="running",
-                    progress=5.0,
-                    message="Discovery started",
+                    status="timeout",
+                    progress=0.0,
+                    message=timeout_message,
+                    error="Provider execution timed out",
                 )
-            log.info("agent.scheduled", provider=name, model=provider.config.model)
-            
-            # Add top-level timeout for each provider (90 minutes max)
-            # Gemini 3 with thinking mode can take 8-10 minutes per segment × 8 segments = ~80 minutes
+            return ProviderRunResult(
+                provider=name,
+                model=provider.config.model,
+                status="timeout",
+                findings=[],
+                telemetry={"error": timeout_message},
+            )
+        company_count = _count_companies(result.findings)
+        telemetry = result.telemetry or {}
+        tool_calls = telemetry.get("tool_calls") or telemetry.get("tool_uses")
+        
+        # Extract cost data if available
+        cost_data = None
+        if result.cost:
+            cost_data = result.cost.to_dict()
+        
+        plog.info(
+            "provider.completed",
+            status=result.status,
+            companies_found=company_count,
+            tool_calls=tool_calls,
+        )
+        if registry and run_id:
+            registry.set_provider_status(
+                run_id,
+                name,
+                status=result.status or "completed",
+                progress=100.0,
+                message="Discovery complete",
+                tool_calls=tool_calls if isinstance(tool_calls, int) else 0,
+                companies_found=company_count,
+                error="; ".join(result.errors) if result.errors else None,
+                cost_data=cost_data,
+            )
+            registry.append_event(
+                run_id,
+                "provider.completed",
+                provider=name,
+                status=result.status,
+                companies_found=company_count,
+                tool_calls=tool_calls,
+                cost=cost_data,
+            )
+        return result
+
+    async def _run_bounded(name: str, provider) -> ProviderRunResult:
+        async with semaphore:
             try:
-                result = await asyncio.wait_for(
-                    provider.run_with_retry(context),
-                    timeout=5400.0,  # 90 minutes max per provider
+                return await _run_single_provider(name, provider)
+            except Exception as exc:  # noqa: BLE001 - isolate failures from sibling providers
+                # Convert failures into failed results here so they never cancel
+                # sibling providers in the task group - we want partial results
+                error_msg = str(exc)
+                log.error(
+                    "provider.failed_with_exception",
+                    provider=name,
+                    error=error_msg,
+                    error_type=type(exc).__name__,
                 )
-            except asyncio.TimeoutError:
-                log.error("provider.timeout", provider=name, timeout_seconds=5400)
                 if registry and run_id:
                     registry.set_provider_status(
                         run_id,
                         name,
-                        status="timeout",
+                        status="failed",
                         progress=0.0,
-                        message="Provider timed out after 90 minutes",
-                        error="Provider execution timed out",
+                        message=f"Provider failed: {type(exc).__name__}",
+                        error=error_msg,
                     )
                 return ProviderRunResult(
                     provider=name,
                     model=provider.config.model,
-                    status="timeout",
+                    status="failed",
                     findings=[],
-                    telemetry={"error": "Provider timed out after 90 minutes"},
+                    telemetry={"error": error_msg},
+                    errors=[{"type": type(exc).__name__, "message": error_msg}],
                 )
-            company_count = _count_companies(result.findings)
-            telemetry = result.telemetry or {}
-            tool_calls = telemetry.get("tool_calls") or telemetry.get("tool_uses")
-            
-            # Extract cost data if available
-            cost_data = None
-            if result.cost:
-                cost_data = result.cost.to_dict()
-            
+
+    discovering = len(agents)
+
+    async def _run_pipelined(name: str, provider) -> ProviderRunResult:
+        nonlocal discovering
+        result = await _run_bounded(name, provider)
+        discovering -= 1
+        if discovering == 0 and on_discovery_complete is not None:
+            on_discovery_complete()
+        if on_result is None:
+            return result
+        try:
+            return await on_result(result)
+        except Exception as exc:  # noqa: BLE001 - isolate failures from sibling providers
+            # Same rule as _run_bounded: a post-processing failure must never
+            # cancel sibling providers. Keep the result, but flag it as
+            # unvalidated so later phases don't treat it as vetted.
+            error_msg = str(exc)
+            log.error(
+                "provider.validation_failed",
+                provider=name,
+                error=error_msg,
+                error_type=type(exc).__name__,
+            )
             if registry and run_id:
                 registry.set_provider_status(
                     run_id,
                     name,
-                    status=result.status or "completed",
+                    status="failed",
                     progress=100.0,
-                    message="Discovery complete",
-                    tool_calls=tool_calls if isinstance(tool_calls, int) else 0,
-                    companies_found=company_count,
-                    error="; ".join(result.errors) if result.errors else None,
-                    cost_data=cost_data,
-                )
-                registry.append_event(
-                    run_id,
-                    "provider.completed",
-                    provider=name,
-                    status=result.status,
-                    companies_found=company_count,
-                    tool_calls=tool_calls,
-                    cost=cost_data,
+                    message=f"Validation failed: {type(exc).__name__}",
+                    error=error_msg,
                 )
-            return result
+            return replace(
+                result,
+                status=VALIDATION_FAILED_STATUS,
+                errors=[*result.errors, {"type": type(exc).__name__, "message": error_msg}],
+            )
 
-        for name, provider in agents:
-            tasks.append(asyncio.create_task(_run_single_provider(name, provider)))
+    if not agents:
+        log.warning("orchestrator.no_providers_enabled")
+        if on_discovery_complete is not None:
+            on_discovery_complete()
+        return []
 
-        if not tasks:
-            log.warning("orchestrator.no_providers_enabled")
-            return []
+    async with asyncio.TaskGroup() as task_group:
+        tasks = [
+            task_group.create_task(_run_pipelined(name, provider))
+            for name, provider in agents
+        ]
+
+    return [task.result() for task in tasks]
 
-        # Use return_exceptions=True to ensure individual provider failures
-        # don't crash the entire orchestrator - we want partial results
-        raw_results = await asyncio.gather(*tasks, return_exceptions=True)
-        
-        # Filter out exceptions and convert them to failed ProviderRunResults
-        results: list[ProviderRunResult] = []
-        for i, result in enumerate(raw_results):
-            if isinstance(result, Exception):
-                provider_name = agents[i][0]
-                provider = agents[i][1]
-                error_msg = str(result)
-                log.error(
-                    "provider.failed_with_exception",
-                    provider=provider_name,
-                    error=error_msg,
-                    error_type=type(result).__name__,
-                )
-                if registry and run_id:
-                    registry.set_provider_status(
-                        run_id,
-                        provider_name,
-                        status="failed",
-                        progress=0.0,
-                        message=f"Provider failed: {type(result).__name__}",
-                        error=error_msg,
-                    )
-                # Create a failed result so we can continue with other providers
-                results.append(
-                    ProviderRunResult(
-                        provider=provider_name,
-                        model=provider.config.model,
-                        status="failed",
-                        findings=[],
-                        telemetry={"error": error_msg},
-                        errors=[{"type": type(result).__name__, "message": error_msg}],
-                    )
-                )
-            else:
-                results.append(result)
-        
-        return results
-    finally:
-        await tool_manager.aclose()
+
+def _companies_of(finding: Any) -> list[Any]:
+    """Return a finding's ``companies`` list, or an empty list if it has none."""
+    if isinstance(finding, dict):
+        companies = finding.get("companies")
+        if isinstance(companies, list):
+            return companies
+    return []
 
 
 def _count_companies(findings: list[Any]) -> int:
-    total = 0
-    for finding in findings or []:
-        if isinstance(finding, dict) and "companies" in finding and isinstance(
-            finding["companies"], list
-        ):
-            total += len(finding["companies"])
-    return total
+    return sum(len(_companies_of(finding)) for finding in findings or [])
 
 
 async def _validate_and_enrich_results(
     results: list[ProviderRunResult],
-    settings: Settings,
+    tool_manager: ToolManager,
+    *,
+    concurrency: int = VALIDATION_CONCURRENCY,
+    semaphore: asyncio.Semaphore | None = None,
 ) -> list[ProviderRunResult]:
-    """Validate and enrich company findings using MCP tools."""
+    """Validate and enrich company findings using MCP tools.
+
+    Segments from all providers are validated concurrently, at most
+    ``concurrency`` at a time. Pass a shared ``semaphore`` to enforce that cap
+    across several calls (it overrides ``concurrency``). Reuses the discovery
+    phase's ``tool_manager``; the caller owns its lifetime.
+    """
     from multiplium.validation import CompanyValidator
 
     log.info("validation.phase_start", provider_count=len(results))
 
-    # Create a new tool manager for validation
-    tool_manager = ToolManager.from_settings(settings.tools, dry_run=False)
     validator = CompanyValidator(tool_manager)
+    if semaphore is None:
+        semaphore = asyncio.Semaphore(concurrency)
+
+    async def _validate_finding(provider: str, finding: dict[str, Any]) -> dict[str, Any]:
+        segment_name = finding.get("name", "Unknown Segment")
+        original_count = len(finding["companies"])
+
+        async with semaphore:
+            log.info(
+                "validation.segment_start",
+                provider=provider,
+                segment=segment_name,
+                company_count=original_count,
+            )
 
-    validated_results = []
-
-    try:
-        for result in results:
-            if not result.findings:
-                validated_results.append(result)
-                continue
+            # Validate and enrich companies
+            validated_companies = await validator.validate_and_enrich_companies(
+                finding["companies"],
+                segment_name,
+            )
 
-            validated_findings = []
-            for finding in result.findings:
-                if not isinstance(finding, dict) or "companies" not in finding:
-                    validated_findings.append(finding)
-                    continue
+        # Append validation summary to a fresh notes list
+        notes = finding.get("notes", [])
+        if not isinstance(notes, list):
+            notes = [notes] if notes else []
 
-                segment_name = finding.get("name", "Unknown Segment")
-                original_count = len(finding["companies"])
+        validation_summary = (
+            f"Validation: {len(validated_companies)}/{original_count} companies passed quality checks "
+            f"(rejected: {original_count - len(validated_companies)})"
+        )
 
-                log.info(
-                    "validation.segment_start",
-                    provider=result.provider,
-                    segment=segment_name,
-                    company_count=original_count,
-                )
+        log.info(
+            "validation.segment_complete",
+            provider=provider,
+            segment=segment_name,
+            validated=len(validated_companies),
+            rejected=original_count - len(validated_companies),
+        )
+        return {**finding, "companies": validated_companies, "notes": [*notes, validation_summary]}
+
+    # (result index, finding index, finding) for every segment with companies
+    pending = [
+        (result_index, finding_index, finding)
+        for result_index, result in enumerate(results)
+        for finding_index, finding in enumerate(result.findings or [])
+        if isinstance(finding, dict) and "companies" in finding
+    ]
+    validated = await asyncio.gather(
+        *(_validate_finding(results[result_index].provider, finding) for result_index, _, finding in pending)
+    )
+    validated_by_position = {
+        (result_index, finding_index): validated_finding
+        for (result_index, finding_index, _), validated_finding in zip(pending, validated)
+    }
 
-                # Validate and enrich companies
-                validated_companies = await validator.validate_and_enrich_companies(
-                    finding["companies"],
-                    segment_name,
-                )
+    validated_results = []
+    for result_index, result in enumerate(results):
+        if not result.findings:
+            validated_results.append(result)
+            continue
+
+        # Create new result with validated findings, keeping original order
+        validated_findings = [
+            validated_by_position.get((result_index, finding_index), finding)
+            for finding_index, finding in enumerate(result.findings)
+        ]
+        validated_results.append(replace(result, findings=validated_findings))
 
-                # Update finding with validated companies
-                validated_finding = finding.copy()
-                validated_finding["companies"] = validated_companies
+    log.info("validation.phase_complete", provider_count=len(validated_results))
+    return validated_results
 
-                # Update notes with validation summary
-                notes = validated_finding.get("notes", [])
-                if not isinstance(notes, list):
-                    notes = [notes] if notes else []
 
-                validation_summary = (
-                    f"Validation: {len(validated_companies)}/{original_count} companies passed quality checks "
-                    f"(rejected: {original_count - len(validated_companies)})"
-                )
-                notes.append(validation_summary)
-                validated_finding["notes"] = notes
+def _phase_progress_callback(
+    registry: RunRegistry,
+    run_id: str,
+    phase: str,
+    start: float,
+    span: float,
+) -> Callable[[int, int], None]:
+    """Map (completed, total) onto ``start..start+span`` percent, throttled.
 
-                validated_findings.append(validated_finding)
+    Intermediate updates are coalesced so large batches don't write the
+    registry once per company; the final update is always written.
+    """
+    last_percent = float("-inf")
+    last_time = 0.0
+
+    def on_progress(completed: int, total: int) -> None:
+        nonlocal last_percent, last_time
+        if total <= 0:
+            return
+        percent = start + (completed / total) * span
+        now = time.monotonic()
+        if (
+            completed >= total
+            or percent - last_percent >= PROGRESS_MIN_STEP
+            or now - last_time >= PROGRESS_MIN_INTERVAL_SECONDS
+        ):
+            registry.mark_phase(run_id, phase, percent)
+            last_percent = percent
+            last_time = now
 
-                log.info(
-                    "validation.segment_complete",
-                    provider=result.provider,
-                    segment=segment_name,
-                    validated=len(validated_companies),
-                    rejected=original_count - len(validated_companies),
-                )
+    return on_progress
 
-            # Create new result with validated findings
-            validated_result = ProviderRunResult(
-                provider=result.provider,
-                model=result.model,
-                status=result.status,
-                findings=validated_findings,
-                telemetry=result.telemetry,
-                errors=result.errors,
-                retry_count=result.retry_count,
-            )
-            validated_results.append(validated_result)
 
-    finally:
-        await tool_manager.aclose()
+def _iter_tagged_companies(results: list[ProviderRunResult]) -> Iterator[dict[str, Any]]:
+    """Yield every company dict, tagged with its provider and segment for tracking.
 
-    log.info("validation.phase_complete", provider_count=len(validated_results))
-    return validated_results
+    Results whose validation failed are skipped: their companies are unvetted.
+    """
+    for result in results:
+        provider = result.provider
+        if result.status == VALIDATION_FAILED_STATUS:
+            log.warning("deep_research.skipping_unvalidated", provider=provider)
+            continue
+        for finding in result.findings:
+            companies = _companies_of(finding)
+            if not companies:
+                continue
+            segment = finding.get("name", "Unknown")
+            for company in companies:
+                if isinstance(company, dict):
+                    company["_source_provider"] = provider
+                    company["_source_segment"] = segment
+                    yield company
 
 
 async def _run_deep_research(
@@ -337,21 +493,7 @@ async def _run_deep_research(
     )
     
     # Collect all companies from all providers
-    all_companies = []
-    for result in results:
-        for finding in result.findings:
-            if not isinstance(finding, dict):
-                continue
-            
-            companies = finding.get("companies", [])
-            for company in companies:
-                if not isinstance(company, dict):
-                    continue
-                
-                # Tag with provider and segment for tracking
-                company["_source_provider"] = result.provider
-                company["_source_segment"] = finding.get("name", "Unknown")
-                all_companies.append(company)
+    all_companies = list(_iter_tagged_companies(results))
     
     log.info(
         "deep_research.companies_collected",
@@ -366,16 +508,13 @@ async def _run_deep_research(
             "error": "No companies available for deep research",
         }
     
-    # Sort by confidence score (descending)
-    sorted_companies = sorted(
+    # Take top N by confidence score (descending); non-dicts were skipped above
+    top_companies = heapq.nlargest(
+        top_n,
         all_companies,
-        key=lambda c: c.get("confidence_0to1", 0) if isinstance(c, dict) else 0,
-        reverse=True,
+        key=lambda c: c.get("confidence_0to1", 0),
     )
     
-    # Take top N
-    top_companies = sorted_companies[:top_n]
-    
     log.info(
         "deep_research.selection",
         selected=len(top_companies),
@@ -392,29 +531,7 @@ async def _run_deep_research(
         progress_callback=progress_callback,
     )
     
-    # Calculate summary statistics
-    completed = sum(
-        1 for c in enriched_companies 
-        if isinstance(c, dict) and c.get("deep_research_status") == "completed"
-    )
-    has_financials = sum(
-        1 for c in enriched_companies 
-        if isinstance(c, dict) and c.get("financials") and c.get("financials") != "Not Disclosed"
-    )
-    has_team = sum(
-        1 for c in enriched_companies 
-        if isinstance(c, dict) and c.get("team")
-    )
-    has_competitors = sum(
-        1 for c in enriched_companies 
-        if isinstance(c, dict) and c.get("competitors")
-    )
-    has_swot = sum(
-        1 for c in enriched_companies 
-        if isinstance(c, dict) and c.get("swot")
-    )
-    
-    return _finalize_deep_research(enriched_companies, completed, has_financials, has_team, has_competitors, has_swot)
+    return _finalize_deep_research(enriched_companies)
 
 
 async def _run_deep_research_on_companies(
@@ -442,40 +559,28 @@ async def _run_deep_research_on_companies(
         progress_callback=progress_callback,
     )
     
-    # Calculate statistics
-    completed = sum(
-        1 for c in enriched_companies 
-        if isinstance(c, dict) and c.get("deep_research_status") == "completed"
-    )
-    has_financials = sum(
-        1 for c in enriched_companies 
-        if isinstance(c, dict) and c.get("financials") and c.get("financials") != "Not Disclosed"
-    )
-    has_team = sum(
-        1 for c in enriched_companies 
-        if isinstance(c, dict) and c.get("team")
-    )
-    has_competitors = sum(
-        1 for c in enriched_companies 
-        if isinstance(c, dict) and c.get("competitors")
-    )
-    has_swot = sum(
-        1 for c in enriched_companies 
-        if isinstance(c, dict) and c.get("swot")
-    )
-    
-    return _finalize_deep_research(enriched_companies, completed, has_financials, has_team, has_competitors, has_swot)
+    return _finalize_deep_research(enriched_companies)
 
 
-def _finalize_deep_research(
-    enriched_companies: list[dict[str, Any]],
-    completed: int,
-    has_financials: int,
-    has_team: int,
-    has_competitors: int,
-    has_swot: int,
-) -> dict[str, Any]:
+def _finalize_deep_research(enriched_companies: list[dict[str, Any]]) -> dict[str, Any]:
     """Finalize deep research results with statistics."""
+    # Tally every statistic in a single pass over the companies
+    completed = has_financials = has_team = has_competitors = has_swot = 0
+    for company in enriched_companies:
+        if not isinstance(company, dict):
+            continue
+        if company.get("deep_research_status") == "completed":
+            completed += 1
+        financials = company.get("financials")
+        if financials and financials != "Not Disclosed":
+            has_financials += 1
+        if company.get("team"):
+            has_team += 1
+        if company.get("competitors"):
+            has_competitors += 1
+        if company.get("swot"):
+            has_swot += 1
+
     log.info(
         "deep_research.complete",
         total=len(enriched_companies),
@@ -503,6 +608,15 @@ def _finalize_deep_research(
     }
 
 
+def _iter_report_companies(report_data: dict[str, Any]) -> Iterator[Any]:
+    """Yield every company in a loaded discovery report, skipping unvalidated results."""
+    for provider_result in report_data.get("providers", []):
+        if provider_result.get("status") == VALIDATION_FAILED_STATUS:
+            continue
+        for finding in provider_result.get("findings", []):
+            yield from _companies_of(finding)
+
+
 async def _deep_research_from_report(
     settings: Settings,
     report_path: Path,
@@ -512,53 +626,58 @@ async def _deep_research_from_report(
     project_id_override: str | None = None,
 ) -> None:
     """Run deep research on companies from an existing discovery report."""
-    import json
+    from itertools import islice
+
+    import orjson
     from multiplium.reporting.writer import write_report
+    from multiplium.runs import RunRegistry
     
     # Load existing report
     if not report_path.exists():
         log.error("report.not_found", path=str(report_path))
         raise FileNotFoundError(f"Report not found: {report_path}")
     
-    with report_path.open("r") as f:
-        report_data = json.load(f)
+    # Parse straight from bytes; context/sector are needed for the output report
+    report_data = orjson.loads(report_path.read_bytes())
     
     log.info("orchestrator.loading_report", path=str(report_path))
     
-    # Extract companies from the report
-    all_companies = []
-    for provider_result in report_data.get("providers", []):
-        for finding in provider_result.get("findings", []):
-            companies = finding.get("companies", [])
-            all_companies.extend(companies)
+    # Count companies per finding list; selection below walks them lazily
+    total_companies = sum(
+        _count_companies(provider_result.get("findings", []))
+        for provider_result in report_data.get("providers", [])
+    )
     
-    if not all_companies:
+    if not total_companies:
         log.warning("orchestrator.no_companies_in_report")
         return
     
     # Filter by selected company names if provided
     if selected_companies:
-        selected_set = set(c.lower() for c in selected_companies)
-        top_companies = [
-            c for c in all_companies
-            if c.get("company", "").lower() in selected_set
-        ][:top_n]
+        selected_set = frozenset(c.lower() for c in selected_companies)
+        top_companies = list(islice(
+            (
+                c for c in _iter_report_companies(report_data)
+                if c.get("company", "").lower() in selected_set
+            ),
+            top_n,
+        ))
         log.info(
             "orchestrator.filtered_by_selection",
             requested=len(selected_companies),
             matched=len(top_companies),
         )
     else:
-        # Sort by confidence and take top N
-        top_companies = sorted(
-            all_companies,
+        # Take top N by confidence without sorting the whole list
+        top_companies = heapq.nlargest(
+            top_n,
+            _iter_report_companies(report_data),
             key=lambda c: c.get("confidence_0to1", 0),
-            reverse=True,
-        )[:top_n]
+        )
     
     log.info(
         "orchestrator.deep_research_from_report",
-        total_companies=len(all_companies),
+        total_companies=total_companies,
         selected=len(top_companies),
     )
     
@@ -582,16 +701,10 @@ async def _deep_research_from_report(
         registry.mark_phase(run_id, "deep_research", 10.0)
         registry.update_snapshot(run_id, status="running")
         
-        # Create progress callback for real-time UI updates
-        def on_progress(completed: int, total: int) -> None:
-            # Scale progress from 10% to 95%
-            percent = 10.0 + (completed / total) * 85.0
-            registry.mark_phase(run_id, "deep_research", percent)
-        
-        # Run deep research with progress callback
+        # Run deep research with progress callback (scaled from 10% to 95%)
         deep_research_data = await _run_deep_research_on_companies(
             top_companies,
-            progress_callback=on_progress,
+            progress_callback=_phase_progress_callback(registry, run_id, "deep_research", 10.0, 85.0),
         )
         
         registry.mark_phase(run_id, "deep_research_complete", 95.0)
@@ -632,6 +745,10 @@ async def _main_async(
     run_id_override: str | None = None,
     project_id_override: str | None = None,
 ) -> None:
+    from multiplium.reporting import write_report
+    from multiplium.runs import RunRegistry
+    from multiplium.tools.manager import ToolManager
+
     registry = RunRegistry()
     project_id = project_id_override or (
         (settings.orchestrator.sector or config_path.stem)
@@ -672,19 +789,46 @@ async def _main_async(
     try:
         context = await _load_context(settings)
         registry.mark_phase(run_id, "discovery", 15.0)
-        results = await _run_agents(
-            context,
-            settings,
-            registry=registry,
-            run_id=run_id,
-        )
-        registry.mark_phase(run_id, "discovery_complete", 55.0)
-
-        # Validation phase: Enrich and validate companies using MCP tools
-        if not settings.orchestrator.dry_run:
-            registry.mark_phase(run_id, "validation", 60.0)
-            results = await _validate_and_enrich_results(results, settings)
-            registry.mark_phase(run_id, "validation_complete", 75.0)
+        # One tool manager serves discovery and validation so HTTP/MCP clients
+        # and their keep-alive connections are set up once per run.
+        async with ToolManager.from_settings(
+            settings.tools,
+            dry_run=settings.orchestrator.dry_run,
+        ) as tool_manager:
+            # Validation phase: Enrich and validate companies using MCP tools.
+            # Each provider's results are validated as soon as that provider
+            # finishes, overlapping with providers that are still running.
+            validate_result = None
+            if not settings.orchestrator.dry_run:
+                # One cap on in-flight segments across all providers' validation
+                validation_semaphore = asyncio.Semaphore(VALIDATION_CONCURRENCY)
+
+                async def validate_result(result: ProviderRunResult) -> ProviderRunResult:
+                    (validated,) = await _validate_and_enrich_results(
+                        [result],
+                        tool_manager,
+                        semaphore=validation_semaphore,
+                    )
+                    return validated
+
+            def discovery_complete() -> None:
+                # Phases keep their baseline order; validation of early
+                # finishers has already started by now
+                registry.mark_phase(run_id, "discovery_complete", 55.0)
+                if validate_result is not None:
+                    registry.mark_phase(run_id, "validation", 60.0)
+
+            results = await _run_agents(
+                context,
+                settings,
+                tool_manager,
+                registry=registry,
+                run_id=run_id,
+                on_result=validate_result,
+                on_discovery_complete=discovery_complete,
+            )
+            if validate_result is not None:
+                registry.mark_phase(run_id, "validation_complete", 75.0)
 
         # Deep research phase: Comprehensive profiles for top N companies
         deep_research_data = None
@@ -692,14 +836,11 @@ async def _main_async(
             registry.mark_phase(run_id, "deep_research", 80.0)
             registry.update_snapshot(run_id, status="running")
             
-            # Create progress callback for real-time UI updates
-            def on_deep_research_progress(completed: int, total: int) -> None:
-                # Scale progress from 80% to 95%
-                percent = 80.0 + (completed / total) * 15.0
-                registry.mark_phase(run_id, "deep_research", percent)
-            
+            # Progress callback for real-time UI updates, scaled from 80% to 95%
             deep_research_data = await _run_deep_research(
-                results, top_n, progress_callback=on_deep_research_progress
+                results,
+                top_n,
+                progress_callback=_phase_progress_callback(registry, run_id, "deep_research", 80.0, 15.0),
             )
             registry.mark_phase(run_id, "deep_research_complete", 95.0)
         else:
@@ -9,35 +9,92 @@ Includes model-specific configuration and prompt mapping for optimal results
 across different LLMs (Gemini 2.5 Pro, Gemini 3, GPT-5.1, Claude 4.5).
 """
 
-from multiplium.prompts.discovery import (
-    build_discovery_system_prompt,
-    build_discovery_user_prompt,
-    get_segment_search_strategies,
-    get_segment_search_queries,
-    DISCOVERY_FEW_SHOT_EXAMPLES,
-)
+from __future__ import annotations
 
-from multiplium.prompts.deep_research import (
-    build_deep_research_prompt,
-    build_verification_prompt,
-    WINE_INDUSTRY_CONTEXT,
-)
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from multiplium.prompts.discovery import (
+        build_discovery_system_prompt,
+        build_discovery_user_prompt,
+        get_segment_search_strategies,
+        get_segment_search_queries,
+        DISCOVERY_FEW_SHOT_EXAMPLES,
+    )
+
+    from multiplium.prompts.deep_research import (
+        build_deep_research_prompt,
+        build_verification_prompt,
+        WINE_INDUSTRY_CONTEXT,
+    )
+
+    from multiplium.prompts.model_config import (
+        ModelFamily,
+        ModelConfig,
+        MODEL_CONFIGS,
+        get_model_config,
+        get_model_family,
+        adapt_prompt_for_model,
+        build_gemini_config,
+        is_gemini_3,
+        is_gemini_2_5,
+        requires_high_temperature,
+        get_recommended_timeout,
+        list_available_models,
+        list_gemini_models,
+    )
+
+# Submodules are imported on first attribute access (PEP 562) so callers that
+# only need one builder don't pay for constructing every prompt table.
+_LAZY_SUBMODULES = {
+    "discovery": (
+        "build_discovery_system_prompt",
+        "build_discovery_user_prompt",
+        "get_segment_search_strategies",
+        "get_segment_search_queries",
+        "DISCOVERY_FEW_SHOT_EXAMPLES",
+    ),
+    "deep_research": (
+        "build_deep_research_prompt",
+        "build_verification_prompt",
+        "WINE_INDUSTRY_CONTEXT",
+    ),
+    "model_config": (
+        "ModelFamily",
+        "ModelConfig",
+        "MODEL_CONFIGS",
+        "get_model_config",
+        "get_model_family",
+        "adapt_prompt_for_model",
+        "build_gemini_config",
+        "is_gemini_3",
+        "is_gemini_2_5",
+        "requires_high_temperature",
+        "get_recommended_timeout",
+        "list_available_models",
+        "list_gemini_models",
+    ),
+}
+_LAZY_ATTRS = {
+    name: f"{__name__}.{module}"
+    for module, names in _LAZY_SUBMODULES.items()
+    for name in names
+}
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_ATTRS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value  # Cache so later lookups skip __getattr__
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *_LAZY_ATTRS})
 
-from multiplium.prompts.model_config import (
-    ModelFamily,
-    ModelConfig,
-    MODEL_CONFIGS,
-    get_model_config,
-    get_model_family,
-    adapt_prompt_for_model,
-    build_gemini_config,
-    is_gemini_3,
-    is_gemini_2_5,
-    requires_high_temperature,
-    get_recommended_timeout,
-    list_available_models,
-    list_gemini_models,
-)
 
 __all__ = [
     # Discovery prompts
@@ -13,8 +13,12 @@ Includes wine industry-specific context and verification steps.
 
 from __future__ import annotations
 
+from collections.abc import Mapping
+from functools import lru_cache
+from types import MappingProxyType
 from typing import Any
 
+import orjson
 
 # =============================================================================
 # WINE INDUSTRY CONTEXT
@@ -110,55 +114,42 @@ WINE_TECH_COMPETITIVE_LANDSCAPE = {
     },
 }
 
-
-# =============================================================================
-# DEEP RESEARCH PROMPT BUILDER
-# =============================================================================
-
-def build_deep_research_prompt(
-    company_name: str,
-    website: str,
-    initial_summary: str,
-    segment: str | None = None,
-) -> str:
-    """
-    Build comprehensive deep research prompt for a company.
-    
-    Uses wine industry context for relevant framing and competitor identification.
-    
-    Args:
-        company_name: Name of the company
-        website: Company website URL
-        initial_summary: Brief description from discovery phase
-        segment: Optional segment classification for competitor context
-    
-    Returns:
-        Formatted prompt for GPT-4o research
-    """
-    # Get relevant competitor context
-    competitor_context = ""
-    if segment:
-        segment_key = _normalize_segment_key(segment)
-        if segment_key in WINE_TECH_COMPETITIVE_LANDSCAPE:
-            landscape = WINE_TECH_COMPETITIVE_LANDSCAPE[segment_key]
-            competitor_context = f"""
+# Freeze the landscape (it's static) and pre-join the name lists used in prompts
+WINE_TECH_COMPETITIVE_LANDSCAPE = MappingProxyType({
+    segment_key: MappingProxyType({
+        "leaders": tuple(entry["leaders"]),
+        "challengers": tuple(entry["challengers"]),
+        "categories": entry["categories"],
+        "leaders_joined": ", ".join(entry["leaders"]),
+        "challengers_joined": ", ".join(entry["challengers"]),
+    })
+    for segment_key, entry in WINE_TECH_COMPETITIVE_LANDSCAPE.items()
+})
+
+# Static part of each segment's competitor block; only the closing
+# "Position <company> ..." line varies per prompt
+_COMPETITOR_CONTEXT_BLOCKS: Mapping[str, str] = MappingProxyType({
+    segment_key: f"""
 **COMPETITIVE LANDSCAPE CONTEXT:**
-- Market leaders: {', '.join(landscape['leaders'])}
-- Challengers: {', '.join(landscape['challengers'])}
+- Market leaders: {landscape['leaders_joined']}
+- Challengers: {landscape['challengers_joined']}
 - Categories: {landscape['categories']}
 
-Position {company_name} relative to these players.
 """
+    for segment_key, landscape in WINE_TECH_COMPETITIVE_LANDSCAPE.items()
+})
 
-    return f"""Research the following wine/agriculture technology company comprehensively.
 
-**COMPANY:** {company_name}
-**WEBSITE:** {website}
-**INITIAL CONTEXT:** {initial_summary}
+# =============================================================================
+# DEEP RESEARCH PROMPT BUILDER
+# =============================================================================
 
-{WINE_INDUSTRY_CONTEXT}
+# Company-independent part of the deep research prompt. It leads the prompt so
+# every company shares the same prefix, which provider-side prompt caching
+# (automatic on OpenAI for prefixes of 1024+ tokens) can reuse across calls.
+DEEP_RESEARCH_INSTRUCTIONS = f"""Research the wine/agriculture technology company described at the end of this prompt comprehensively.
 
-{competitor_context}
+{WINE_INDUSTRY_CONTEXT}
 
 **GATHER THE FOLLOWING DATA (return as structured JSON):**
 
@@ -171,8 +162,8 @@ Position {company_name} relative to these players.
 
 **2. COMPETITIVE LANDSCAPE:**
 - 3-5 direct competitors in wine/agriculture technology
-- For each competitor: name, brief description, key differentiator vs. {company_name}
-- How {company_name} differentiates (unique technology, approach, target market)
+- For each competitor: name, brief description, key differentiator vs. the company
+- How the company differentiates (unique technology, approach, target market)
 - Competitive advantages (patents, proprietary data, partnerships)
 - Market positioning (premium vs. value, target customer size)
 
@@ -196,45 +187,15 @@ Position {company_name} relative to these players.
 - Key partnerships that indicate scale
 
 **WINE INDUSTRY SPECIFIC SEARCHES:**
-Search for "{company_name}" in combination with:
+Search for the company name in combination with:
 - "vineyard deployment" OR "winery customer" OR "viticulture"
 - "funding raised" OR "series A B C" OR "investment round"
 - "award winner" OR "innovation award" OR "wine industry"
 - Major wine industry publications: Wines & Vines, Wine Business Monthly, Decanter
 
-**RETURN JSON STRUCTURE:**
-{{
-  "team": {{
-    "founders": ["name1 - background", "name2 - background"],
-    "executives": ["CEO: name - background", "CTO: name - background"],
-    "size": "X employees",
-    "advisors": ["advisor1 - relevance"],
-    "wine_experience": "Summary of team's wine/ag background"
-  }},
-  "competitors": {{
-    "direct": [
-      {{"name": "Competitor1", "description": "...", "vs_target": "How {company_name} differentiates"}}
-    ],
-    "differentiation": "Key competitive advantages of {company_name}",
-    "market_position": "Target segment and positioning"
-  }},
-  "evidence_of_impact": {{
-    "case_studies": [{{"client": "name", "metric": "30% water reduction", "source": "URL"}}],
-    "academic_papers": ["DOI or title"],
-    "awards": ["Award name (Year)"],
-    "certifications": ["Certification name"]
-  }},
-  "key_clients": {{
-    "named_clients": ["Client1", "Client2"],
-    "geographies": ["Country1", "Country2"],
-    "segments": ["Premium wineries", "Cooperatives", etc]
-  }},
-  "financial_signals": {{
-    "funding_rounds": [{{"round": "Series A", "amount": 5000000, "date": "2023", "lead": "Investor"}}],
-    "revenue_signals": "Any disclosed or estimated revenue",
-    "growth_indicators": ["100 vineyard deployments", "50% YoY customer growth"]
-  }}
-}}
+**RETURN FORMAT:**
+Return a single JSON object matching the provided response schema
+(team, competitors, evidence_of_impact, key_clients, financial_signals).
 
 **IMPORTANT:**
 - Only include information you can verify with sources
@@ -244,6 +205,116 @@ Search for "{company_name}" in combination with:
 """
 
 
+def _schema_object(**properties: Any) -> dict[str, Any]:
+    """Strict-mode JSON schema object: every property required, no extras."""
+    return {
+        "type": "object",
+        "properties": properties,
+        "required": list(properties),
+        "additionalProperties": False,
+    }
+
+
+def _schema_array(items: dict[str, Any]) -> dict[str, Any]:
+    return {"type": "array", "items": items}
+
+
+_SCHEMA_TEXT = {"type": ["string", "null"]}
+_SCHEMA_TEXT_LIST = _schema_array({"type": "string"})
+
+# Output shape for build_deep_research_prompt, sent out-of-band as a
+# structured-output schema instead of being spelled out in the prompt text
+DEEP_RESEARCH_RESPONSE_SCHEMA: dict[str, Any] = _schema_object(
+    team=_schema_object(
+        founders=_SCHEMA_TEXT_LIST,
+        executives=_SCHEMA_TEXT_LIST,
+        size=_SCHEMA_TEXT,
+        advisors=_SCHEMA_TEXT_LIST,
+        wine_experience=_SCHEMA_TEXT,
+    ),
+    competitors=_schema_object(
+        direct=_schema_array(_schema_object(
+            name={"type": "string"},
+            description=_SCHEMA_TEXT,
+            vs_target=_SCHEMA_TEXT,
+        )),
+        differentiation=_SCHEMA_TEXT,
+        market_position=_SCHEMA_TEXT,
+    ),
+    evidence_of_impact=_schema_object(
+        case_studies=_schema_array(_schema_object(
+            client=_SCHEMA_TEXT,
+            metric=_SCHEMA_TEXT,
+            source=_SCHEMA_TEXT,
+        )),
+        academic_papers=_SCHEMA_TEXT_LIST,
+        awards=_SCHEMA_TEXT_LIST,
+        certifications=_SCHEMA_TEXT_LIST,
+    ),
+    key_clients=_schema_object(
+        named_clients=_SCHEMA_TEXT_LIST,
+        geographies=_SCHEMA_TEXT_LIST,
+        segments=_SCHEMA_TEXT_LIST,
+    ),
+    financial_signals=_schema_object(
+        funding_rounds=_schema_array(_schema_object(
+            round=_SCHEMA_TEXT,
+            amount={"type": ["number", "string", "null"]},
+            date=_SCHEMA_TEXT,
+            lead=_SCHEMA_TEXT,
+        )),
+        revenue_signals=_SCHEMA_TEXT,
+        growth_indicators=_SCHEMA_TEXT_LIST,
+    ),
+)
+
+# OpenAI chat-completions ``response_format`` for deep research calls
+DEEP_RESEARCH_RESPONSE_FORMAT: dict[str, Any] = {
+    "type": "json_schema",
+    "json_schema": {
+        "name": "deep_research",
+        "schema": DEEP_RESEARCH_RESPONSE_SCHEMA,
+        "strict": True,
+    },
+}
+
+
+def build_deep_research_prompt(
+    company_name: str,
+    website: str,
+    initial_summary: str,
+    segment: str | None = None,
+) -> str:
+    """
+    Build comprehensive deep research prompt for a company.
+    
+    Uses wine industry context for relevant framing and competitor identification.
+    The static instructions come first and the company-specific details last,
+    keeping the prompt prefix identical (and cacheable) across companies.
+    
+    Args:
+        company_name: Name of the company
+        website: Company website URL
+        initial_summary: Brief description from discovery phase
+        segment: Optional segment classification for competitor context
+    
+    Returns:
+        Formatted prompt for GPT-4o research
+    """
+    # Get relevant competitor context
+    competitor_context = ""
+    if segment:
+        block = _COMPETITOR_CONTEXT_BLOCKS.get(_normalize_segment_key(segment))
+        if block:
+            competitor_context = f"{block}Position {company_name} relative to these players.\n"
+
+    return f"""{DEEP_RESEARCH_INSTRUCTIONS}
+**COMPANY:** {company_name}
+**WEBSITE:** {website}
+**INITIAL CONTEXT:** {initial_summary}
+{competitor_context}"""
+
+
 def build_verification_prompt(
     company_data: dict[str, Any],
     original_summary: str,
@@ -262,34 +333,32 @@ def build_verification_prompt(
     """
     company_name = company_data.get("company", "Unknown")
     
-    # Extract key claims to verify
-    claims_to_verify = []
+    # Extract key claims to verify, formatted as bullets in a single pass
+    claims = []
+    append = claims.append
     
     # Team claims
-    team = company_data.get("team", {})
-    if team.get("founders"):
-        claims_to_verify.append(f"Founders: {team['founders']}")
-    if team.get("size"):
-        claims_to_verify.append(f"Team size: {team['size']}")
+    team = company_data.get("team") or _EMPTY
+    if founders := team.get("founders"):
+        append(f"- Founders: {founders}")
+    if size := team.get("size"):
+        append(f"- Team size: {size}")
     
     # Evidence claims
-    evidence = company_data.get("evidence_of_impact", {})
-    for case_study in evidence.get("case_studies", [])[:3]:
+    evidence = company_data.get("evidence_of_impact") or _EMPTY
+    for case_study in evidence.get("case_studies", ())[:3]:
         if isinstance(case_study, dict):
-            claims_to_verify.append(f"Case study: {case_study.get('client', '')} - {case_study.get('metric', '')}")
+            append(f"- Case study: {case_study.get('client', '')} - {case_study.get('metric', '')}")
         elif isinstance(case_study, str):
-            claims_to_verify.append(f"Case study: {case_study}")
+            append(f"- Case study: {case_study}")
     
     # Financial claims
-    financials = company_data.get("financial_signals", {}) or company_data.get("financial_enrichment", {})
-    funding_rounds = financials.get("funding_rounds", [])
-    for round_data in funding_rounds[:2]:
+    financials = _first_nonempty(company_data, "financial_signals", "financial_enrichment")
+    for round_data in financials.get("funding_rounds", ())[:2]:
         if isinstance(round_data, dict):
-            claims_to_verify.append(
-                f"Funding: {round_data.get('round', 'Unknown')} - ${round_data.get('amount', 'N/A')}"
-            )
+            append(f"- Funding: {round_data.get('round', 'Unknown')} - ${round_data.get('amount', 'N/A')}")
     
-    claims_text = "\n".join([f"- {claim}" for claim in claims_to_verify]) if claims_to_verify else "- No specific claims to verify"
+    claims_text = "\n".join(claims) if claims else "- No specific claims to verify"
     
     return f"""**VERIFICATION TASK for {company_name}**
 
@@ -338,34 +407,37 @@ Review the following research findings for accuracy and completeness.
 Provide a brief explanation for your verification decision."""
 
 
+# (substring, landscape key) in priority order: the first substring found wins
+_SEGMENT_KEY_MAPPINGS = (
+    ("soil", "soil_health"),
+    ("irrigation", "irrigation"),
+    ("water", "irrigation"),
+    ("pest", "ipm_pest"),
+    ("ipm", "ipm_pest"),
+    ("canopy", "canopy_robotics"),
+    ("robot", "canopy_robotics"),
+    ("carbon", "carbon_traceability"),
+    ("trace", "carbon_traceability"),
+    ("mrv", "carbon_traceability"),
+    ("vineyard", "vineyard_management"),
+    ("grape", "vineyard_management"),
+    ("production", "winery_production"),
+    ("vinification", "winery_production"),
+    ("winery", "winery_production"),
+    ("ferment", "winery_production"),
+    ("packag", "packaging"),
+    ("bottle", "packaging"),
+    ("distribut", "distribution"),
+    ("logistic", "distribution"),
+)
+
+
+@lru_cache(maxsize=512)
 def _normalize_segment_key(segment: str) -> str:
     """Normalize segment name to match landscape keys."""
     segment_lower = segment.lower()
     
-    mappings = {
-        "soil": "soil_health",
-        "irrigation": "irrigation",
-        "water": "irrigation",
-        "pest": "ipm_pest",
-        "ipm": "ipm_pest",
-        "canopy": "canopy_robotics",
-        "robot": "canopy_robotics",
-        "carbon": "carbon_traceability",
-        "trace": "carbon_traceability",
-        "mrv": "carbon_traceability",
-        "vineyard": "vineyard_management",
-        "grape": "vineyard_management",
-        "production": "winery_production",
-        "vinification": "winery_production",
-        "winery": "winery_production",
-        "ferment": "winery_production",
-        "packag": "packaging",
-        "bottle": "packaging",
-        "distribut": "distribution",
-        "logistic": "distribution",
-    }
-    
-    for key, value in mappings.items():
+    for key, value in _SEGMENT_KEY_MAPPINGS:
         if key in segment_lower:
             return value
     
@@ -392,7 +464,7 @@ def build_swot_prompt(company_data: dict[str, Any]) -> str:
     team = company_data.get("team", {})
     competitors = company_data.get("competitors", {})
     evidence = company_data.get("evidence_of_impact", {})
-    financials = company_data.get("financial_enrichment", {}) or company_data.get("financial_signals", {})
+    financials = _first_nonempty(company_data, "financial_enrichment", "financial_signals")
     
     return f"""Generate a SWOT analysis for {company_name} based on the following research data.
 
@@ -437,14 +509,32 @@ def build_swot_prompt(company_data: dict[str, Any]) -> str:
 Make each bullet specific and actionable for an investment decision."""
 
 
-def _format_dict(d: dict | None) -> str:
-    """Format a dictionary for prompt inclusion."""
+# Shared read-only stand-in for a missing section
+_EMPTY: Mapping[str, Any] = MappingProxyType({})
+
+
+def _first_nonempty(data: dict[str, Any], *keys: str) -> Mapping[str, Any]:
+    """Return the first truthy value among ``keys`` in ``data``, else an empty mapping."""
+    for key in keys:
+        value = data.get(key)
+        if value:
+            return value
+    return _EMPTY
+
+
+_PROMPT_JSON_OPTIONS = orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+
+
+def _format_dict(d: Mapping[str, Any] | None, limit: int = 2000) -> str:
+    """Format a dictionary for prompt inclusion, truncated to ``limit`` chars."""
     if not d:
         return "No data available"
     
-    import json
     try:
-        return json.dumps(d, indent=2, default=str)[:2000]  # Limit size
-    except Exception:
-        return str(d)[:2000]
+        encoded = orjson.dumps(d, default=str, option=_PROMPT_JSON_OPTIONS)
+    except orjson.JSONEncodeError:
+        return str(d)[:limit]
+    # A char is at most 4 UTF-8 bytes, so only decode what can survive the cut;
+    # a character split at the byte boundary always lies past ``limit``
+    return encoded[: limit * 4].decode("utf-8", errors="ignore")[:limit]
 
@@ -442,6 +442,21 @@ Return your findings as a valid JSON object. Start with { and end with }. No mar
 """
 
 
+# Few-shot companies serialized once at import, pre-indented to sit under
+# {"segment": {"companies": ...}} in the rendered example
+_FEW_SHOT_COMPANIES_JSON = json.dumps(DISCOVERY_FEW_SHOT_EXAMPLES[:3], indent=2).replace("\n", "\n    ")
+
+
+def _render_few_shot_examples(segment_name: str) -> str:
+    """Render the few-shot example block for a segment."""
+    return (
+        '{\n  "segment": {\n    "name": '
+        f"{json.dumps(segment_name)},\n"
+        f'    "companies": {_FEW_SHOT_COMPANIES_JSON}\n'
+        "  }\n}"
+    )
+
+
 # =============================================================================
 # PROMPT BUILDERS
 # =============================================================================
@@ -478,9 +493,7 @@ def build_discovery_system_prompt(
     # Build examples section
     examples_section = ""
     if include_examples:
-        # Select 2-3 relevant examples
-        examples = DISCOVERY_FEW_SHOT_EXAMPLES[:3]
-        examples_json = json.dumps({"segment": {"name": segment_name, "companies": examples}}, indent=2)
+        examples_json = _render_few_shot_examples(segment_name)
         examples_section = f"""
 **EXAMPLE OUTPUT (follow this exact structure for {segment_name}):**
 ```
@@ -14,9 +14,12 @@ Supported Models:
 
 from __future__ import annotations
 
+from collections.abc import Mapping
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import Any
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Any, Literal
 
 
 class ModelFamily(Enum):
@@ -28,9 +31,9 @@ class ModelFamily(Enum):
     UNKNOWN = "unknown"
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ModelConfig:
-    """Configuration for a specific model."""
+    """Configuration for a specific model (immutable, so lookups can be cached and shared)."""
     
     # Model identification
     model_id: str
@@ -65,14 +68,14 @@ class ModelConfig:
     system_instruction_position: str = "config"  # "config", "first_message", "both"
     
     # Special requirements
-    notes: list[str] = field(default_factory=list)
+    notes: tuple[str, ...] = ()
 
 
 # =============================================================================
 # MODEL REGISTRY
 # =============================================================================
 
-MODEL_CONFIGS: dict[str, ModelConfig] = {
+MODEL_CONFIGS: Mapping[str, ModelConfig] = MappingProxyType({
     # Gemini 2.5 Pro - Excellent for reasoning, coding, STEM
     "gemini-2.5-pro": ModelConfig(
         model_id="gemini-2.5-pro",
@@ -85,12 +88,12 @@ MODEL_CONFIGS: dict[str, ModelConfig] = {
         supports_google_search=True,
         prefers_structured_output=True,
         needs_json_instruction_in_prompt=True,
-        notes=[
+        notes=(
             "Best for complex multi-step reasoning",
             "Excellent at code generation and analysis",
             "Long context window (1M tokens)",
             "Lower temperature works well (0.1-0.3)",
-        ],
+        ),
     ),
     
     # Gemini 2.5 Pro Preview (alias)
@@ -105,7 +108,7 @@ MODEL_CONFIGS: dict[str, ModelConfig] = {
         supports_google_search=True,
         prefers_structured_output=True,
         needs_json_instruction_in_prompt=True,
-        notes=["Preview version of Gemini 2.5 Pro"],
+        notes=("Preview version of Gemini 2.5 Pro",),
     ),
     
     # Gemini 3 Pro Preview - Advanced multimodal, extended thinking
@@ -124,12 +127,12 @@ MODEL_CONFIGS: dict[str, ModelConfig] = {
         supports_google_search=True,
         prefers_structured_output=True,
         needs_json_instruction_in_prompt=True,
-        notes=[
+        notes=(
             "REQUIRES temperature=1.0 (lower values cause looping)",
             "Supports ThinkingConfig for extended reasoning",
             "Best for complex multi-step analysis",
             "May need longer timeouts due to thinking",
-        ],
+        ),
     ),
     
     # GPT-5.1 - Latest OpenAI flagship
@@ -146,11 +149,11 @@ MODEL_CONFIGS: dict[str, ModelConfig] = {
         prefers_json_mode=True,
         needs_json_instruction_in_prompt=True,
         system_instruction_position="config",
-        notes=[
+        notes=(
             "400K context window",
             "Optimized for agentic tasks",
             "Native web search via Responses API",
-        ],
+        ),
     ),
     
     # GPT-4o - Strong multimodal
@@ -166,7 +169,23 @@ MODEL_CONFIGS: dict[str, ModelConfig] = {
         prefers_structured_output=True,
         prefers_json_mode=True,
         needs_json_instruction_in_prompt=False,  # JSON mode handles it
-        notes=["Good balance of speed and capability"],
+        notes=("Good balance of speed and capability",),
+    ),
+    
+    # GPT-4o mini - Cheap tier for checklist-style tasks
+    "gpt-4o-mini": ModelConfig(
+        model_id="gpt-4o-mini",
+        family=ModelFamily.GPT,
+        display_name="GPT-4o mini",
+        default_temperature=0.15,
+        max_input_tokens=128_000,
+        max_output_tokens=16_384,
+        supports_thinking=False,
+        supports_web_search=True,
+        prefers_structured_output=True,
+        prefers_json_mode=True,
+        needs_json_instruction_in_prompt=False,
+        notes=("Low cost; suited to verification and short structured synthesis",),
     ),
     
     # Claude 4.5 Sonnet
@@ -182,14 +201,15 @@ MODEL_CONFIGS: dict[str, ModelConfig] = {
         supports_web_search=True,
         prefers_structured_output=True,
         needs_json_instruction_in_prompt=True,
-        notes=[
+        notes=(
             "Extended thinking for complex reasoning",
             "Excellent tool use capabilities",
-        ],
+        ),
     ),
-}
+})
 
 
+@lru_cache(maxsize=64)
 def get_model_config(model_id: str) -> ModelConfig:
     """
     Get configuration for a specific model.
@@ -224,7 +244,7 @@ def get_model_config(model_id: str) -> ModelConfig:
         model_id=model_id,
         family=family,
         display_name=model_id,
-        notes=["Unknown model - using default settings"],
+        notes=("Unknown model - using default settings",),
     )
 
 
@@ -233,6 +253,51 @@ def get_model_family(model_id: str) -> ModelFamily:
     return get_model_config(model_id).family
 
 
+# =============================================================================
+# TASK ROUTING - Match each deep-research prompt to a model tier
+# =============================================================================
+
+TaskProfile = Literal["deep_research", "verification", "swot"]
+
+TASK_MODELS: dict[str, str] = {
+    # Heavy reasoning over web results
+    "deep_research": "gpt-4o",
+    # Checklist-style critique of gathered data
+    "verification": "gpt-4o-mini",
+    # Short structured synthesis
+    "swot": "gpt-4o-mini",
+}
+
+
+def pick_model(
+    task: TaskProfile,
+    overrides: Mapping[str, str] | None = None,
+) -> ModelConfig:
+    """
+    Pick the model configuration for a deep-research task.
+    
+    Args:
+        task: Which prompt is being dispatched
+        overrides: Optional task -> model_id mapping that takes precedence
+    
+    Returns:
+        ModelConfig for the override if given, else the default for the task.
+        Unregistered IDs get default settings but keep the requested ID, so
+        the caller always dispatches exactly the model it asked for.
+    """
+    model_id = (overrides or {}).get(task) or TASK_MODELS[task]
+    config = MODEL_CONFIGS.get(model_id)
+    if config is None:
+        # No prefix matching here: that would swap in another model's ID
+        config = ModelConfig(
+            model_id=model_id,
+            family=get_model_family(model_id),
+            display_name=model_id,
+            notes=("Unknown model - using default settings",),
+        )
+    return config
+
+
 # =============================================================================
 # PROMPT ADAPTERS - Model-specific prompt transformations
 # =============================================================================
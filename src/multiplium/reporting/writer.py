@@ -1,10 +1,11 @@
 from __future__ import annotations
 
-import json
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any, Iterable
 
+import orjson
+
 from multiplium.providers.base import ProviderRunResult
 
 
@@ -45,15 +46,16 @@ def write_report(
         payload["deep_research"] = deep_research
 
     output_path.parent.mkdir(parents=True, exist_ok=True)
-    report_json = json.dumps(payload, indent=2, ensure_ascii=True)
-    output_path.write_text(report_json, encoding="utf-8")
+    # Same 2-space layout as before; non-ASCII is written as UTF-8 rather than \u escapes
+    report_json = orjson.dumps(payload, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    output_path.write_bytes(report_json)
 
     # Persist timestamped snapshot to reports/new/ folder
     timestamp_suffix = generated_at.strftime("%Y%m%dT%H%M%SZ")
     new_reports_dir = output_path.parent / "new"
     new_reports_dir.mkdir(parents=True, exist_ok=True)
     timestamped_path = new_reports_dir / f"report_{timestamp_suffix}{output_path.suffix}"
-    timestamped_path.write_text(report_json, encoding="utf-8")
+    timestamped_path.write_bytes(report_json)
 
 
 def _enhance_deep_research_stats(deep_research: dict[str, Any]) -> dict[str, Any]:
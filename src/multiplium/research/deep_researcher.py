@@ -22,11 +22,13 @@ Financial Enrichment System:
 from __future__ import annotations
 
 import asyncio
+import copy
 import json
 import re
 import structlog
 from typing import Any, Callable
 
+from multiplium.prompts.model_config import pick_model
 from multiplium.tools.perplexity_mcp import PerplexityMCPClient
 from multiplium.research.financial_enricher import FinancialEnricher
 
@@ -35,6 +37,7 @@ try:
     from multiplium.prompts.deep_research import (
         build_deep_research_prompt,
         build_verification_prompt,
+        DEEP_RESEARCH_RESPONSE_FORMAT,
         WINE_INDUSTRY_CONTEXT,
     )
     PROMPTS_AVAILABLE = True
@@ -69,6 +72,12 @@ class DeepResearcher:
         import os
         from openai import AsyncOpenAI
         self.openai = AsyncOpenAI(api_key=os.getenv("OPENAI_API_KEY"))
+        # GPT-4o research keyed by normalized (company, website, segment): the
+        # same company often arrives from several providers in one run. The
+        # segment is part of the key because it selects the prompt's
+        # competitor context.
+        self._gpt4o_results: dict[tuple[str, str, str], asyncio.Task[dict[str, Any]]] = {}
+        self._gpt4o_cache_stats = {"hits": 0, "misses": 0}
     
     async def research_company(
         self,
@@ -213,7 +222,10 @@ class DeepResearcher:
         progress_callback: Callable[[int, int], None] | None = None,
     ) -> list[dict[str, Any]]:
         """
-        Process multiple companies in parallel batches.
+        Process multiple companies in parallel, at most ``max_concurrent`` at a time.
+        
+        A new company starts as soon as any in-flight one finishes, so one slow
+        company no longer holds back the rest of a fixed-size batch.
         
         Args:
             companies: List of company dicts from discovery
@@ -234,27 +246,22 @@ class DeepResearcher:
             depth=depth,
         )
         
-        results = []
         total_companies = len(companies)
+        semaphore = asyncio.Semaphore(max_concurrent)
+        finished = 0
         
-        for i in range(0, len(companies), max_concurrent):
-            batch = companies[i:i+max_concurrent]
-            batch_num = (i // max_concurrent) + 1
-            
-            logger.info(
-                "deep_research.batch_processing",
-                batch=batch_num,
-                batch_size=len(batch),
-            )
+        async def _research_one(company: dict[str, Any]) -> dict[str, Any]:
+            nonlocal finished
+            async with semaphore:
+                result = await self.research_company(company, depth=depth)
             
-            batch_results = await asyncio.gather(*[
-                self.research_company(c, depth=depth) for c in batch
-            ])
-            results.extend(batch_results)
-            
-            # Report progress after each batch
+            # Report progress as each company finishes
+            finished += 1
             if progress_callback:
-                progress_callback(len(results), total_companies)
+                progress_callback(finished, total_companies)
+            return result
+        
+        results = await asyncio.gather(*[_research_one(c) for c in companies])
         
         # Summary statistics
         completed = sum(1 for r in results if r.get("deep_research_status") == "completed")
@@ -349,6 +356,43 @@ Cite all sources with URLs.
                 "revenue_3yr": "Not Disclosed",
             }
     
+    async def _call_gpt4o_json(self, prompt: str) -> dict[str, Any]:
+        """Run the comprehensive GPT-4o research prompt and parse its JSON reply."""
+        # The unified prompt relies on the structured-output schema for its
+        # shape; the legacy prompt still spells the JSON out inline
+        response_format = (
+            DEEP_RESEARCH_RESPONSE_FORMAT if PROMPTS_AVAILABLE else {"type": "json_object"}
+        )
+        
+        # Use GPT-4o with web search
+        response = await self.openai.chat.completions.create(
+            model=pick_model("deep_research").model_id,
+            messages=[
+                {"role": "system", "content": "You are a research analyst gathering company intelligence. Use web search to find accurate, current information. Return structured JSON only."},
+                {"role": "user", "content": prompt}
+            ],
+            response_format=response_format,
+            temperature=0.1,
+        )
+        
+        # Parse response
+        result_text = response.choices[0].message.content
+        return json.loads(result_text)
+    
+    def _evict_failed_gpt4o(
+        self,
+        cache_key: tuple[str, str, str],
+        task: asyncio.Task[dict[str, Any]],
+    ) -> None:
+        """Drop a failed GPT-4o task from the cache so the next caller retries.
+        
+        Runs as a done callback, so failures are evicted (and their exception
+        retrieved) even when every awaiting caller was cancelled.
+        """
+        if task.cancelled() or task.exception() is not None:
+            if self._gpt4o_results.get(cache_key) is task:
+                del self._gpt4o_results[cache_key]
+    
     async def _research_with_gpt4o(
         self,
         company_name: str,
@@ -435,20 +479,36 @@ Return JSON with this structure:
 """
         
         try:
-            # Use GPT-4o with web search
-            response = await self.openai.chat.completions.create(
-                model="gpt-4o",
-                messages=[
-                    {"role": "system", "content": "You are a research analyst gathering company intelligence. Use web search to find accurate, current information. Return structured JSON only."},
-                    {"role": "user", "content": comprehensive_prompt}
-                ],
-                response_format={"type": "json_object"},
-                temperature=0.1,
+            cache_key = (
+                (company_name or "").strip().lower(),
+                (website or "").strip().lower().rstrip("/"),
+                (segment or "").strip().lower(),
             )
+            task = self._gpt4o_results.get(cache_key)
+            if task is None:
+                self._gpt4o_cache_stats["misses"] += 1
+                logger.info(
+                    "deep_research.gpt4o.cache_miss",
+                    company=company_name,
+                    **self._gpt4o_cache_stats,
+                )
+                task = asyncio.ensure_future(self._call_gpt4o_json(comprehensive_prompt))
+                self._gpt4o_results[cache_key] = task
+                task.add_done_callback(
+                    lambda done, key=cache_key: self._evict_failed_gpt4o(key, done)
+                )
+            else:
+                self._gpt4o_cache_stats["hits"] += 1
+                logger.info(
+                    "deep_research.gpt4o.cache_hit",
+                    company=company_name,
+                    **self._gpt4o_cache_stats,
+                )
             
-            # Parse response
-            result_text = response.choices[0].message.content
-            result_data = json.loads(result_text)
+            # Shield so one caller's cancellation doesn't fail the others
+            result_data = await asyncio.shield(task)
+            # Each company profile gets its own copy to merge and mutate
+            result_data = copy.deepcopy(result_data)
             
             logger.info(
                 "deep_research.gpt4o.success",
@@ -925,7 +985,7 @@ Prioritize Crunchbase, LinkedIn, company website, and wine industry publications
             )
             
             response = await self.openai.chat.completions.create(
-                model="gpt-4o",
+                model=pick_model("verification").model_id,
                 messages=[
                     {
                         "role": "system",
@@ -0,0 +1,100 @@
+from __future__ import annotations
+
+import asyncio
+import json
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from multiplium.research.deep_researcher import DeepResearcher
+
+
+def _completion(payload: dict) -> MagicMock:
+    response = MagicMock()
+    response.choices[0].message.content = json.dumps(payload)
+    return response
+
+
+@pytest.fixture
+def researcher():
+    """DeepResearcher with its external clients mocked out."""
+    with (
+        patch("multiplium.research.deep_researcher.PerplexityMCPClient"),
+        patch("multiplium.research.deep_researcher.FinancialEnricher"),
+        patch("openai.AsyncOpenAI"),
+    ):
+        instance = DeepResearcher()
+    instance.openai = MagicMock()
+    return instance
+
+
+class TestGpt4oSingleFlight:
+    """Test the in-run GPT-4o research cache."""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_calls_share_one_request(self, researcher):
+        """Two concurrent lookups for the same company make one API call."""
+        create = AsyncMock(return_value=_completion({"team": {"size": "10 employees"}}))
+        researcher.openai.chat.completions.create = create
+
+        first, second = await asyncio.gather(
+            researcher._research_with_gpt4o("Acme", "https://acme.com", "summary", "Irrigation"),
+            researcher._research_with_gpt4o("acme ", "https://ACME.com/", "other", "irrigation"),
+        )
+
+        assert create.await_count == 1
+        assert first == second == {"team": {"size": "10 employees"}}
+        assert first is not second  # Each caller gets its own copy
+
+    @pytest.mark.asyncio
+    async def test_segment_is_part_of_the_key(self, researcher):
+        """The same company in another segment gets its own segment-framed research."""
+        create = AsyncMock(return_value=_completion({}))
+        researcher.openai.chat.completions.create = create
+
+        await researcher._research_with_gpt4o("Acme", "https://acme.com", "summary", "Irrigation")
+        await researcher._research_with_gpt4o("Acme", "https://acme.com", "summary", "Soil Health")
+
+        assert create.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_failed_call_is_evicted_and_retried(self, researcher):
+        """A failed request is not cached; the next lookup calls the API again."""
+        create = AsyncMock(
+            side_effect=[RuntimeError("rate limited"), _completion({"team": {"size": "5"}})]
+        )
+        researcher.openai.chat.completions.create = create
+
+        failed = await researcher._research_with_gpt4o("Acme", "https://acme.com", "summary")
+        retried = await researcher._research_with_gpt4o("Acme", "https://acme.com", "summary")
+
+        assert failed["team"]["founders"] == []  # Fallback payload
+        assert retried == {"team": {"size": "5"}}
+        assert create.await_count == 2
+        assert researcher._gpt4o_cache_stats == {"hits": 0, "misses": 2}
+
+    @pytest.mark.asyncio
+    async def test_failure_after_all_callers_cancelled_is_evicted(self, researcher):
+        """A task whose callers were all cancelled is still evicted when it fails."""
+        release = asyncio.Event()
+
+        async def create(**kwargs):
+            await release.wait()
+            raise RuntimeError("upstream error")
+
+        researcher.openai.chat.completions.create = create
+
+        caller = asyncio.create_task(
+            researcher._research_with_gpt4o("Acme", "https://acme.com", "summary")
+        )
+        await asyncio.sleep(0)
+        caller.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await caller
+        assert len(researcher._gpt4o_results) == 1
+
+        release.set()
+        for _ in range(5):
+            await asyncio.sleep(0)
+
+        assert researcher._gpt4o_results == {}
@@ -0,0 +1,79 @@
+from __future__ import annotations
+
+import random
+
+from multiplium.impact_scoring import calculate_pareto_frontier
+
+KEYWORDS = [
+    "soil carbon", "water", "emissions", "biodiversity", "employment", "community",
+    "health", "tier 1", "certified", "b corp", "revenue", "growing", "commercial",
+    "pilot", "prototype",
+]
+
+
+def _brute_force_frontier(scored: list[dict]) -> list[str]:
+    """Reference O(N^2) dominance check over already-scored companies."""
+    frontier = []
+    for candidate in scored:
+        impact = candidate["impact_score"]["overall_impact"]
+        financial = candidate["impact_score"]["financial_viability"]
+        dominated = any(
+            other["impact_score"]["overall_impact"] > impact
+            and other["impact_score"]["financial_viability"] > financial
+            for other in scored
+        )
+        if not dominated:
+            frontier.append(candidate["company"])
+    return frontier
+
+
+def test_pareto_frontier_matches_pairwise_dominance():
+    """Sweep-based frontier keeps exactly the non-dominated companies, in composite order."""
+    rng = random.Random(7)
+    companies = [
+        {
+            "company": f"Company {i}",
+            "summary": " ".join(rng.choices(KEYWORDS, k=rng.randint(0, 6))),
+            "kpi_alignment": [" ".join(rng.choices(KEYWORDS, k=rng.randint(0, 4)))],
+            "sources": ["https://example.com"] * rng.randint(0, 3),
+        }
+        for i in range(150)
+    ]
+
+    frontier = calculate_pareto_frontier(companies)
+
+    # Score everything (frontier of a single company is that company)
+    scored = [calculate_pareto_frontier([company])[0] for company in companies]
+    scored.sort(key=lambda x: x["composite_score"], reverse=True)
+
+    assert [c["company"] for c in frontier] == _brute_force_frontier(scored)
+
+
+def test_pareto_frontier_keeps_ties():
+    """Companies with identical scores do not dominate each other."""
+    companies = [
+        {"company": "A", "summary": "commercial revenue", "kpi_alignment": ["water"]},
+        {"company": "B", "summary": "commercial revenue", "kpi_alignment": ["water"]},
+    ]
+
+    frontier = calculate_pareto_frontier(companies)
+
+    assert [c["company"] for c in frontier] == ["A", "B"]
+
+
+def test_pareto_frontier_reuses_existing_impact_scores():
+    """Re-ranking scored companies with new weights keeps their dimension scores."""
+    companies = [
+        {"company": "A", "summary": "commercial revenue growing", "kpi_alignment": ["water 30%"]},
+        {"company": "B", "summary": "pilot", "kpi_alignment": ["soil carbon"]},
+    ]
+    scored = [calculate_pareto_frontier([company])[0] for company in companies]
+
+    reranked = calculate_pareto_frontier(scored, impact_weight=1.0, financial_weight=0.0)
+
+    originals = {c["company"]: c for c in scored}
+    assert reranked
+    for company in reranked:
+        original = originals[company["company"]]
+        assert company["impact_score"] is original["impact_score"]
+        assert company["composite_score"] == original["impact_score"]["overall_impact"]
@@ -0,0 +1,52 @@
+from __future__ import annotations
+
+import pytest
+
+from multiplium.prompts.model_config import (
+    MODEL_CONFIGS,
+    TASK_MODELS,
+    ModelFamily,
+    pick_model,
+)
+
+
+@pytest.mark.parametrize("task", sorted(TASK_MODELS))
+def test_pick_model_uses_routing_table(task):
+    """Each task resolves to its registered default model."""
+    config = pick_model(task)
+
+    assert config.model_id == TASK_MODELS[task]
+    assert config is MODEL_CONFIGS[TASK_MODELS[task]]
+
+
+def test_pick_model_verification_routes_to_cheaper_tier():
+    assert pick_model("verification").model_id == "gpt-4o-mini"
+    assert pick_model("deep_research").model_id == "gpt-4o"
+
+
+def test_pick_model_registered_override():
+    """Overrides for registered models return that model's config."""
+    config = pick_model("swot", {"swot": "claude-sonnet-4-5-20250929"})
+
+    assert config is MODEL_CONFIGS["claude-sonnet-4-5-20250929"]
+
+
+@pytest.mark.parametrize(
+    ("override", "family"),
+    [
+        ("gpt-4.1-mini", ModelFamily.GPT),
+        ("claude-3-haiku", ModelFamily.CLAUDE),
+    ],
+)
+def test_pick_model_unknown_override_keeps_requested_id(override, family):
+    """Unregistered overrides are dispatched as-is, never prefix-matched to another model."""
+    config = pick_model("verification", {"verification": override})
+
+    assert config.model_id == override
+    assert config.family is family
+
+
+def test_pick_model_ignores_overrides_for_other_tasks():
+    config = pick_model("deep_research", {"verification": "gpt-4.1-mini"})
+
+    assert config.model_id == TASK_MODELS["deep_research"]
@@ -0,0 +1,157 @@
+from __future__ import annotations
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from multiplium.orchestrator import _run_agents, _validate_and_enrich_results
+from multiplium.providers.base import ProviderRunResult
+
+
+def _mock_settings(concurrency: int = 2) -> MagicMock:
+    settings = MagicMock()
+    settings.orchestrator.concurrency = concurrency
+    return settings
+
+
+def _mock_provider(name: str, delay: float = 0.0) -> MagicMock:
+    """Provider whose run_with_retry completes after ``delay`` seconds."""
+    provider = MagicMock()
+    provider.config.model = f"{name}-model"
+    provider.config.timeout_seconds = 60.0
+
+    async def _run(context):
+        await asyncio.sleep(delay)
+        return ProviderRunResult(
+            provider=name,
+            model=f"{name}-model",
+            status="completed",
+            findings=[{"name": "Segment", "companies": [{"company": f"{name} Co"}]}],
+            telemetry={},
+        )
+
+    provider.run_with_retry = _run
+    return provider
+
+
+async def _run_with_agents(agents, **kwargs) -> list[ProviderRunResult]:
+    with patch("multiplium.providers.ProviderFactory") as mock_factory_class:
+        mock_factory_class.return_value.iter_active_agents.return_value = agents
+        return await _run_agents(MagicMock(), _mock_settings(), AsyncMock(), **kwargs)
+
+
+class TestPipelinedPostProcessing:
+    """Test the on_result / on_discovery_complete hooks run by _run_agents."""
+
+    async def test_failing_on_result_marks_result_unvalidated(self):
+        """A validation failure is flagged on its result and doesn't cancel siblings."""
+        registry = MagicMock()
+        agents = [
+            ("fast", _mock_provider("fast")),
+            ("slow", _mock_provider("slow", delay=0.05)),
+        ]
+
+        async def on_result(result: ProviderRunResult) -> ProviderRunResult:
+            if result.provider == "fast":
+                raise RuntimeError("MCP tool error")
+            return result
+
+        results = await _run_with_agents(
+            agents,
+            registry=registry,
+            run_id="run-1",
+            on_result=on_result,
+        )
+
+        assert [r.provider for r in results] == ["fast", "slow"]
+        assert [r.status for r in results] == ["validation_failed", "completed"]
+        assert results[0].errors == [{"type": "RuntimeError", "message": "MCP tool error"}]
+        assert results[1].errors == []
+        failed_updates = [
+            call for call in registry.set_provider_status.call_args_list
+            if call.kwargs.get("status") == "failed"
+        ]
+        assert len(failed_updates) == 1
+        assert failed_updates[0].args == ("run-1", "fast")
+        assert failed_updates[0].kwargs["error"] == "MCP tool error"
+
+    async def test_discovery_complete_fires_before_validation_finishes(self):
+        """on_discovery_complete runs once, after the last provider's discovery."""
+        events: list[str] = []
+        agents = [
+            ("first", _mock_provider("first")),
+            ("second", _mock_provider("second", delay=0.02)),
+        ]
+
+        async def on_result(result: ProviderRunResult) -> ProviderRunResult:
+            events.append(f"validating:{result.provider}")
+            await asyncio.sleep(0.05)
+            events.append(f"validated:{result.provider}")
+            return result
+
+        await _run_with_agents(
+            agents,
+            on_result=on_result,
+            on_discovery_complete=lambda: events.append("discovery_complete"),
+        )
+
+        assert events.count("discovery_complete") == 1
+        complete_at = events.index("discovery_complete")
+        assert events.index("validating:second") > complete_at
+        assert events.index("validated:second") > complete_at
+        assert events.index("validating:first") < complete_at
+
+    async def test_discovery_complete_fires_without_providers(self):
+        on_discovery_complete = MagicMock()
+
+        results = await _run_with_agents([], on_discovery_complete=on_discovery_complete)
+
+        assert results == []
+        on_discovery_complete.assert_called_once_with()
+
+
+class TestValidationConcurrency:
+    """Test the validation cap shared across per-provider calls."""
+
+    @pytest.fixture
+    def provider_result(self) -> ProviderRunResult:
+        return ProviderRunResult(
+            provider="test_provider",
+            model="test-model",
+            status="completed",
+            findings=[
+                {"name": "Segment A", "companies": [{"company": "Acme"}]},
+                {"name": "Segment B", "companies": [{"company": "Beta"}]},
+            ],
+            telemetry={},
+        )
+
+    async def test_shared_semaphore_caps_validation_across_calls(self, provider_result):
+        """Concurrent validation calls sharing a semaphore stay under one cap."""
+        in_flight = 0
+        peak = 0
+
+        async def validate(companies, segment_name):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return companies
+
+        semaphore = asyncio.Semaphore(1)
+        with patch("multiplium.validation.CompanyValidator") as mock_validator_class:
+            mock_validator_class.return_value.validate_and_enrich_companies = validate
+            await asyncio.gather(
+                *(
+                    _validate_and_enrich_results(
+                        [provider_result],
+                        AsyncMock(),
+                        semaphore=semaphore,
+                    )
+                    for _ in range(3)
+                )
+            )
+
+        assert peak == 1